@@ -27,12 +27,21 @@ def run_gui():
     main()
 
 
+def _flush_output(out):
+    """Escribe las líneas acumuladas en una sola llamada a stdout y vacía el buffer."""
+    if out:
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
+        out.clear()
+
+
 def run_cli():
     """Run in command-line interface mode."""
-    print("=" * 60)
-    print("🫏 GALAXIAS - Sistema del Burro Astronauta 🌟")
-    print("=" * 60)
-    print()
+    out = []
+    out.append("=" * 60)
+    out.append("🫏 GALAXIAS - Sistema del Burro Astronauta 🌟")
+    out.append("=" * 60)
+    out.append("")
     
     # Load configuration
     with open('data/spaceship_config.json', 'r') as f:
@@ -50,26 +59,27 @@ def run_cli():
     optimizer = DonkeyRouteOptimizer(space_map)
     
     # Display available stars
-    print("Estrellas disponibles:")
+    out.append("Estrellas disponibles:")
     stars_list = space_map.get_all_stars_list()
     for i, star in enumerate(stars_list, 1):
         hypergiant_mark = "⭐" if star.hypergiant else "✨"
-        print(f"  {i}. {hypergiant_mark} {star.label} ({star.id}) - Energía: {star.amount_of_energy}, Radio: {star.radius}")
-    print()
+        out.append(f"  {i}. {hypergiant_mark} {star.label} ({star.id}) - Energía: {star.amount_of_energy}, Radio: {star.radius}")
+    out.append("")
     
     # Show burro status
-    print("Estado inicial del Burro Astronauta:")
+    out.append("Estado inicial del Burro Astronauta:")
     status = burro.get_status()
-    print(f"  Energía: {status['energia']}%")
-    print(f"  Pasto: {status['pasto']} kg")
-    print(f"  Edad: {status['edad']} años")
-    print(f"  Estado de salud: {status['estado_salud']}")
-    print()
+    out.append(f"  Energía: {status['energia']}%")
+    out.append(f"  Pasto: {status['pasto']} kg")
+    out.append(f"  Edad: {status['edad']} años")
+    out.append(f"  Estado de salud: {status['estado_salud']}")
+    out.append("")
     
     # Get user input for route type
-    print("Opciones:")
-    print("1. Calcular ruta directa entre dos estrellas")
-    print("2. Optimizar ruta para comer máximo número de estrellas")
+    out.append("Opciones:")
+    out.append("1. Calcular ruta directa entre dos estrellas")
+    out.append("2. Optimizar ruta para comer máximo número de estrellas")
+    _flush_output(out)
     
     try:
         option = int(input("Seleccione opción (1-2): "))
@@ -83,7 +93,8 @@ def run_cli():
                 start_star = stars_list[start_idx]
                 end_star = stars_list[end_idx]
                 
-                print(f"\nCalculando ruta de {start_star.label} a {end_star.label}...")
+                out.append(f"\nCalculando ruta de {start_star.label} a {end_star.label}...")
+                _flush_output(out)
                 
                 # Calculate path
                 path, cost = calculator.dijkstra(start_star, end_star)
@@ -91,23 +102,23 @@ def run_cli():
                 if path:
                     path_stats = calculator.calculate_path_stats(path)
                     
-                    print("\n" + "=" * 60)
-                    print("RUTA ENCONTRADA")
-                    print("=" * 60)
-                    print(f"Costo total: {cost:.2f}")
-                    print(f"Distancia: {path_stats['total_distance']} unidades")
-                    print(f"Saltos: {path_stats['num_jumps']}")
-                    print(f"Peligro: {path_stats['total_danger']}")
-                    print(f"\nRuta: {' → '.join(path_stats['path_stars'])}")
-                    print(f"\nRecursos necesarios:")
-                    print(f"  - Energía para viajar: {path_stats['total_energy_needed']:.2f}")
-                    print(f"  - Pasto necesario: {path_stats['total_grass_needed']:.2f} kg")
-                    print(f"  - Energía ganada: {path_stats['total_energy_gained']:.2f}")
-                    print(f"  - Balance neto: {path_stats['net_energy']:.2f}")
+                    out.append("\n" + "=" * 60)
+                    out.append("RUTA ENCONTRADA")
+                    out.append("=" * 60)
+                    out.append(f"Costo total: {cost:.2f}")
+                    out.append(f"Distancia: {path_stats['total_distance']} unidades")
+                    out.append(f"Saltos: {path_stats['num_jumps']}")
+                    out.append(f"Peligro: {path_stats['total_danger']}")
+                    out.append(f"\nRuta: {' → '.join(path_stats['path_stars'])}")
+                    out.append(f"\nRecursos necesarios:")
+                    out.append(f"  - Energía para viajar: {path_stats['total_energy_needed']:.2f}")
+                    out.append(f"  - Pasto necesario: {path_stats['total_grass_needed']:.2f} kg")
+                    out.append(f"  - Energía ganada: {path_stats['total_energy_gained']:.2f}")
+                    out.append(f"  - Balance neto: {path_stats['net_energy']:.2f}")
                 else:
-                    print("\n❌ No se encontró ruta entre estas estrellas.")
+                    out.append("\n❌ No se encontró ruta entre estas estrellas.")
             else:
-                print("Índices inválidos.")
+                out.append("Índices inválidos.")
         
         elif option == 2:
             # Optimize route for eating stars
@@ -116,35 +127,38 @@ def run_cli():
             if 0 <= start_idx < len(stars_list):
                 start_star = stars_list[start_idx]
                 
-                print(f"\nOptimizando ruta desde {start_star.label} para comer máximo número de estrellas...")
+                out.append(f"\nOptimizando ruta desde {start_star.label} para comer máximo número de estrellas...")
+                _flush_output(out)
                 
                 # Optimize route
                 optimal_path, stats = optimizer.optimize_route_from_json_data(start_star.id)
                 
                 if stats.get('error'):
-                    print(f"\n❌ Error: {stats['error']}")
+                    out.append(f"\n❌ Error: {stats['error']}")
                 elif optimal_path:
-                    print("\n" + "=" * 60)
-                    print("RUTA OPTIMIZADA ENCONTRADA")
-                    print("=" * 60)
-                    print(f"Estrellas visitadas: {stats['stars_visited']}")
-                    print(f"Energía final: {stats['final_energy']}%")
-                    print(f"Pasto final: {stats['final_grass']} kg")
-                    print(f"Estado final: {stats['final_health_state']}")
-                    print(f"Éxito: {'SÍ' if stats['success'] else 'NO'}")
-                    print(f"\nRuta optimizada: {' → '.join(stats['route'])}")
+                    out.append("\n" + "=" * 60)
+                    out.append("RUTA OPTIMIZADA ENCONTRADA")
+                    out.append("=" * 60)
+                    out.append(f"Estrellas visitadas: {stats['stars_visited']}")
+                    out.append(f"Energía final: {stats['final_energy']}%")
+                    out.append(f"Pasto final: {stats['final_grass']} kg")
+                    out.append(f"Estado final: {stats['final_health_state']}")
+                    out.append(f"Éxito: {'SÍ' if stats['success'] else 'NO'}")
+                    out.append(f"\nRuta optimizada: {' → '.join(stats['route'])}")
                 else:
-                    print("\n❌ No se pudo encontrar una ruta optimizada.")
+                    out.append("\n❌ No se pudo encontrar una ruta optimizada.")
             else:
-                print("Índice inválido.")
+                out.append("Índice inválido.")
         
         else:
-            print("Opción inválida.")
+            out.append("Opción inválida.")
+        _flush_output(out)
         
         # Generate visualization
         response = input("\n¿Generar visualización? (s/n): ").lower()
         if response == 's':
-            print("\nGenerando visualización...")
+            out.append("\nGenerando visualización...")
+            _flush_output(out)
             if option == 1 and 'path' in locals() and path:
                 visualizer.plot_space_map(
                     highlight_path=path,
@@ -157,20 +171,23 @@ def run_cli():
                     donkey_location=burro.current_location,
                     save_path='assets/space_map.png'
                 )
-            print("Visualización guardada en: assets/space_map.png")
+            out.append("Visualización guardada en: assets/space_map.png")
     
     except (ValueError, KeyboardInterrupt):
-        print("\nOperación cancelada.")
+        out.append("\nOperación cancelada.")
     except Exception as e:
-        print(f"\nError: {e}")
+        out.append(f"\nError: {e}")
+    finally:
+        _flush_output(out)
 
 
 def run_demo():
     """Run a demonstration of the system."""
-    print("=" * 60)
-    print("🫏 GALAXIAS - DEMOSTRACIÓN DEL BURRO ASTRONAUTA 🌟")
-    print("=" * 60)
-    print()
+    out = []
+    out.append("=" * 60)
+    out.append("🫏 GALAXIAS - DEMOSTRACIÓN DEL BURRO ASTRONAUTA 🌟")
+    out.append("=" * 60)
+    out.append("")
     
     # Load configuration
     with open('data/spaceship_config.json', 'r') as f:
@@ -187,63 +204,66 @@ def run_demo():
     visualizer = SpaceVisualizer(space_map)
     optimizer = DonkeyRouteOptimizer(space_map)
     
-    print("1. Estado inicial del burro:")
+    out.append("1. Estado inicial del burro:")
     status = burro.get_status()
-    print(f"   Energía: {status['energia']}%")
-    print(f"   Pasto: {status['pasto']} kg")
-    print(f"   Estado: {status['estado_salud']}")
+    out.append(f"   Energía: {status['energia']}%")
+    out.append(f"   Pasto: {status['pasto']} kg")
+    out.append(f"   Estado: {status['estado_salud']}")
     
-    print("\n2. Estrellas disponibles:")
+    out.append("\n2. Estrellas disponibles:")
     stars_list = space_map.get_all_stars_list()
     for star in stars_list[:5]:  # Show first 5
         hypergiant_mark = "⭐" if star.hypergiant else "✨"
-        print(f"   {hypergiant_mark} {star.label} - Energía: {star.amount_of_energy}, Radio: {star.radius}")
+        out.append(f"   {hypergiant_mark} {star.label} - Energía: {star.amount_of_energy}, Radio: {star.radius}")
     
-    print("\n3. Calculando ruta optimizada...")
+    out.append("\n3. Calculando ruta optimizada...")
+    _flush_output(out)
     start_star = stars_list[0]
     optimal_path, stats = optimizer.optimize_route_from_json_data(start_star.id)
     
     if optimal_path and stats.get('success'):
-        print(f"   ✅ Ruta optimizada encontrada")
-        print(f"   Estrellas visitadas: {stats['stars_visited']}")
-        print(f"   Energía final: {stats['final_energy']}%")
-        print(f"   Ruta: {' → '.join(stats['route'][:5])}{'...' if len(stats['route']) > 5 else ''}")
+        out.append(f"   ✅ Ruta optimizada encontrada")
+        out.append(f"   Estrellas visitadas: {stats['stars_visited']}")
+        out.append(f"   Energía final: {stats['final_energy']}%")
+        out.append(f"   Ruta: {' → '.join(stats['route'][:5])}{'...' if len(stats['route']) > 5 else ''}")
     else:
-        print("   ❌ No se pudo optimizar la ruta")
+        out.append("   ❌ No se pudo optimizar la ruta")
     
-    print("\n4. Agregando cometa que bloquea rutas...")
+    out.append("\n4. Agregando cometa que bloquea rutas...")
     # Get first two stars for demonstration
     if len(stars_list) >= 2:
         star1, star2 = stars_list[0], stars_list[1]
         comet = Comet(name="Cometa Halley", blocked_routes=[(star1.id, star2.id)])
         space_map.add_comet(comet)
-        print(f"   ✅ Cometa agregado bloqueando ruta entre {star1.label} y {star2.label}")
+        out.append(f"   ✅ Cometa agregado bloqueando ruta entre {star1.label} y {star2.label}")
     
-    print("\n5. Recalculando con cometa...")
+    out.append("\n5. Recalculando con cometa...")
+    _flush_output(out)
     optimal_path2, stats2 = optimizer.optimize_route_from_json_data(start_star.id)
     
     if optimal_path2:
-        print(f"   ✅ Nueva ruta encontrada evitando el cometa")
-        print(f"   Estrellas visitadas: {stats2['stars_visited']}")
-        print(f"   Energía final: {stats2['final_energy']}%")
+        out.append(f"   ✅ Nueva ruta encontrada evitando el cometa")
+        out.append(f"   Estrellas visitadas: {stats2['stars_visited']}")
+        out.append(f"   Energía final: {stats2['final_energy']}%")
     else:
-        print("   ❌ No se pudo encontrar nueva ruta")
+        out.append("   ❌ No se pudo encontrar nueva ruta")
     
-    print("\n6. Generando visualizaciones...")
+    out.append("\n6. Generando visualizaciones...")
+    _flush_output(out)
     visualizer.plot_space_map(
         highlight_path=optimal_path2 if optimal_path2 else optimal_path,
         donkey_location=burro.current_location,
         save_path='assets/demo_space_map.png',
         show=False
     )
-    print("   ✅ Mapa guardado: assets/demo_space_map.png")
+    out.append("   ✅ Mapa guardado: assets/demo_space_map.png")
     
     visualizer.plot_resource_status(
         burro,
         save_path='assets/demo_resources.png',
         show=False
     )
-    print("   ✅ Estado de recursos guardado: assets/demo_resources.png")
+    out.append("   ✅ Estado de recursos guardado: assets/demo_resources.png")
     
     if optimal_path2 or optimal_path:
         path_to_use = optimal_path2 if optimal_path2 else optimal_path
@@ -256,12 +276,13 @@ def run_demo():
             save_path='assets/demo_report.png',
             show=False
         )
-        print("   ✅ Reporte guardado: assets/demo_report.png")
+        out.append("   ✅ Reporte guardado: assets/demo_report.png")
     
-    print("\n" + "=" * 60)
-    print("DEMOSTRACIÓN COMPLETADA")
-    print("Archivos generados en la carpeta 'assets/'")
-    print("=" * 60)
+    out.append("\n" + "=" * 60)
+    out.append("DEMOSTRACIÓN COMPLETADA")
+    out.append("Archivos generados en la carpeta 'assets/'")
+    out.append("=" * 60)
+    _flush_output(out)
 
 
 def main():
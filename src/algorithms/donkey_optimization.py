@@ -15,6 +15,7 @@ class DonkeyRouteOptimizer:
     def __init__(self, space_map: SpaceMap):
         self.space_map = space_map
         self.calculator = RouteCalculator(space_map, self._get_default_config())
+        self._all_stars = tuple(space_map.get_all_stars_list())
     
     def _get_default_config(self) -> Dict:
         """Configuración por defecto para cálculos."""
@@ -60,6 +61,7 @@ class DonkeyRouteOptimizer:
             return [], {"error": "El burro está muerto, no puede viajar"}
         
         visited_stars = []
+        visited_ids: Set[str] = set()  # Se mantiene a la par de visited_stars
         current_star = start_star
         iterations = 0
         
@@ -80,15 +82,16 @@ class DonkeyRouteOptimizer:
                iterations < max_iterations):
             
             # Intentar comer la estrella actual si es posible y beneficioso
-            if working_burro.can_eat_star(current_star) and current_star not in visited_stars:
+            if working_burro.can_eat_star(current_star) and current_star.id not in visited_ids:
                 benefit = self.calculate_star_eating_benefit(current_star)
                 if benefit > 0:  # Solo comer si es beneficioso
                     visited_stars.append(current_star)
+                    visited_ids.add(current_star.id)
                     working_burro.consume_resources_eating_star(current_star)
             
             # Encontrar la siguiente mejor estrella
             next_star = self._find_next_optimal_star(
-                current_star, visited_stars, working_burro
+                current_star, visited_stars, working_burro, visited_ids
             )
             
             if next_star is None:
@@ -101,11 +104,7 @@ class DonkeyRouteOptimizer:
                 break
             
             # Calcular distancia total del camino
-            total_distance = 0
-            for i in range(len(path) - 1):
-                route = self._find_route_between_stars(path[i], path[i + 1])
-                if route:
-                    total_distance += route.distance
+            total_distance = self._path_distance(path)
             
             # Verificar si puede hacer el viaje
             if not working_burro.can_travel(total_distance):
@@ -139,14 +138,16 @@ class DonkeyRouteOptimizer:
     def _find_next_optimal_star(self, 
                                current: Star, 
                                visited: List[Star], 
-                               burro: BurroAstronauta) -> Optional[Star]:
+                               burro: BurroAstronauta,
+                               visited_ids: Optional[Set[str]] = None) -> Optional[Star]:
         """Encuentra la siguiente estrella óptima para visitar."""
-        visited_ids = {star.id for star in visited}
+        if visited_ids is None:
+            visited_ids = {star.id for star in visited}
         best_star = None
         best_score = -1
         
         # Evaluar todas las estrellas no visitadas
-        for star in self.space_map.get_all_stars_list():
+        for star in self._all_stars:
             if star.id in visited_ids:
                 continue
             
@@ -156,11 +157,7 @@ class DonkeyRouteOptimizer:
                 continue
             
             # Calcular distancia real del camino
-            total_distance = 0
-            for i in range(len(path) - 1):
-                route = self._find_route_between_stars(path[i], path[i + 1])
-                if route:
-                    total_distance += route.distance
+            total_distance = self._path_distance(path)
             
             # Verificar si puede viajar hasta allí
             if not burro.can_travel(total_distance):
@@ -193,13 +190,14 @@ class DonkeyRouteOptimizer:
         
         return best_star
     
+    def _path_distance(self, path: List[Star]) -> float:
+        """Suma las distancias de las rutas del camino (búsqueda O(1) por salto)."""
+        route_distance = self.space_map.route_distance
+        return sum(route_distance(a.id, b.id) for a, b in zip(path, path[1:]))
+    
     def _find_route_between_stars(self, star1: Star, star2: Star) -> Optional['Route']:
         """Encuentra la ruta entre dos estrellas."""
-        for route in self.space_map.routes:
-            if ((route.from_star == star1 and route.to_star == star2) or
-                (route.to_star == star1 and route.from_star == star2)):
-                return route
-        return None
+        return self.calculator.get_route_between(star1, star2)
     
     def optimize_route_from_json_data(self, start_star_id: str) -> Tuple[List[Star], Dict]:
         """
@@ -231,7 +229,7 @@ class DonkeyRouteOptimizer:
         best_star = None
         max_stars_visited = 0
         
-        all_stars = self.space_map.get_all_stars_list()
+        all_stars = self._all_stars
         
         for star in all_stars:
             route, stats = self.optimize_route_from_json_data(star.id)
@@ -12,6 +12,7 @@ import json
 from typing import List, Dict, Optional, Tuple, Set
 from dataclasses import dataclass
 from ..core import SpaceMap, Star, BurroAstronauta, Route
+from ..utils.json_handler import JSONHandler
 
 
 @dataclass
@@ -35,14 +36,15 @@ class HyperGiantJumpSystem:
         self.space_map = space_map
         self.constellation_map = self._build_constellation_map()
         self.hypergiant_stars = self._find_hypergiant_stars()
+        # Estrellas agrupadas por constelación (orden del mapa), calculado una vez
+        self._stars_by_constellation = self._group_stars_by_constellation()
         
     def _build_constellation_map(self) -> Dict[str, str]:
         """Construye mapeo de estrella_id -> nombre_constelación."""
         constellation_map = {}
         
         try:
-            with open('data/constellations.json', 'r') as f:
-                data = json.load(f)
+            data = JSONHandler.load_json_cached('data/constellations.json')
             
             for constellation in data.get('constellations', []):
                 constellation_name = constellation['name']
@@ -55,6 +57,14 @@ class HyperGiantJumpSystem:
             
         return constellation_map
     
+    def _group_stars_by_constellation(self) -> Dict[str, List[Star]]:
+        """Agrupa las estrellas del mapa por nombre de constelación."""
+        groups: Dict[str, List[Star]] = {}
+        for star in self.space_map.get_all_stars_list():
+            constellation = self.constellation_map.get(star.id)
+            groups.setdefault(constellation, []).append(star)
+        return groups
+    
     def _find_hypergiant_stars(self) -> List[Star]:
         """Encuentra todas las estrellas hipergigantes."""
         return [star for star in self.space_map.get_all_stars_list() 
@@ -101,15 +111,10 @@ class HyperGiantJumpSystem:
             
             # Solo considerar hipergigantes de la misma constelación actual
             if hypergiant_constellation == from_constellation:
-                # Buscar ruta directa
-                for route in self.space_map.routes:
-                    if route.blocked:
-                        continue
-                        
-                    if ((route.from_star.id == from_star.id and route.to_star.id == hypergiant.id) or
-                        (route.to_star.id == from_star.id and route.from_star.id == hypergiant.id)):
-                        accessible.append((hypergiant, route.distance))
-                        break
+                # Buscar ruta directa (índice por extremos, sin recorrer todas las rutas)
+                route = self.space_map.get_route_between(from_star.id, hypergiant.id)
+                if route is not None and not route.blocked:
+                    accessible.append((hypergiant, route.distance))
         
         # Ordenar por distancia
         accessible.sort(key=lambda x: x[1])
@@ -125,13 +130,7 @@ class HyperGiantJumpSystem:
         Returns:
             List[Star]: Estrellas disponibles en la constelación
         """
-        destinations = []
-        
-        for star in self.space_map.get_all_stars_list():
-            if self.get_star_constellation(star) == target_constellation:
-                destinations.append(star)
-        
-        return destinations
+        return list(self._stars_by_constellation.get(target_constellation, ()))
     
     def can_perform_hypergiant_jump(self, burro: BurroAstronauta, 
                                    hypergiant: Star, 
@@ -2,30 +2,90 @@
 Route calculation algorithms for finding optimal paths through space.
 """
 import heapq
-from typing import Dict, List, Optional, Tuple
+import numpy as np
+from array import array
+from collections import deque
+from typing import Callable, Dict, List, Optional, Set, Tuple
 from ..core import Star, Route, SpaceMap
-from ..utils.burro_utils.burro_math import calculate_energy_from_eating
+from ..utils.burro_utils.burro_math import calculate_energy_from_eating, energy_from_eating
 from ..utils.json_handler import JSONHandler
 
 def get_route_and_stats(space_map, path):
-    total_distance = 0
-    total_danger = 0
-    for i in range(len(path) - 1):
-        route = next((r for r in space_map.routes if
-                      (r.from_star == path[i] and r.to_star == path[i+1]) or
-                      (r.to_star == path[i] and r.from_star == path[i+1])), None)
-        if route:
-            total_distance += route.distance
-            total_danger += route.danger_level
-    return total_distance, total_danger
+    # Posición de cada tramo en los arreglos de rutas; -1 si el tramo no existe
+    positions = space_map.route_positions
+    idx = np.fromiter((positions.get((a.id, b.id), -1) for a, b in zip(path, path[1:])),
+                      dtype=np.int64, count=max(len(path) - 1, 0))
+    idx = idx[idx >= 0]
+    return (float(space_map.route_arrays['distance'][idx].sum()),
+            int(space_map.route_arrays['danger_level'][idx].sum()))
+
+def get_energy_and_grass(path, star_arrays: Optional[Dict[str, np.ndarray]] = None):
+    if star_arrays is None:
+        return (sum(calculate_energy_from_eating(star, 1.0, 1.0) for star in path),
+                sum(star.time_to_eat * 5 for star in path))
+    idx = np.fromiter((star.index for star in path), dtype=np.int64, count=len(path))
+    energy = energy_from_eating(star_arrays['amount_of_energy'][idx], star_arrays['radius'][idx], 1.0, 1.0)
+    grass = star_arrays['time_to_eat'][idx] * 5
+    return float(energy.sum()), int(grass.sum())
+
+def _dijkstra_core(indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray,
+                   start: int, end: int) -> Tuple[np.ndarray, float]:
+    """
+    Núcleo de Dijkstra sobre un grafo en formato CSR (solo enteros y flotantes).
+    
+    Returns:
+        Tupla (predecesores, costo hasta end); predecesor -1 indica sin predecesor
+    """
+    n = indptr.shape[0] - 1
+    dist = np.full(n, np.inf)
+    prev = np.full(n, -1, dtype=np.int64)
+    done = np.zeros(n, dtype=np.bool_)
+    dist[start] = 0.0
+    heap = [(0.0, start)]
+    while len(heap) > 0:
+        cost, node = heapq.heappop(heap)
+        if done[node]:
+            continue
+        done[node] = True
+        if node == end:
+            break
+        for k in range(indptr[node], indptr[node + 1]):
+            nxt = indices[k]
+            if done[nxt]:
+                continue
+            new_cost = cost + weights[k]
+            if new_cost < dist[nxt]:
+                dist[nxt] = new_cost
+                prev[nxt] = node
+                heapq.heappush(heap, (new_cost, nxt))
+    return prev, dist[end]
+
+
+_dijkstra_core_native = None
+_native_core_loaded = False
+
+
+def _get_native_core():
+    """
+    Núcleo de Dijkstra compilado con numba, o None si numba no está instalado.
+    
+    numba es opcional y costoso de importar, así que se carga en el primer uso
+    y no al importar el módulo.
+    """
+    global _dijkstra_core_native, _native_core_loaded
+    if not _native_core_loaded:
+        _native_core_loaded = True
+        try:
+            from numba import njit
+        except ImportError:
+            njit = None
+        if njit is not None:
+            _dijkstra_core_native = njit(cache=True)(_dijkstra_core)
+    return _dijkstra_core_native
+
+# A partir de este tamaño find_all_reachable_stars usa delta-stepping vectorizado
+DELTA_STEP_MIN_STARS = 256
 
-def get_energy_and_grass(path):
-    total_energy = 0
-    total_grass = 0
-    for star in path:
-        total_energy += calculate_energy_from_eating(star, 1.0, 1.0)
-        total_grass += star.time_to_eat * 5
-    return total_energy, total_grass
 
 class RouteCalculator:
     """Calculate optimal routes between stars using graph algorithms."""
@@ -33,12 +93,153 @@ class RouteCalculator:
     def __init__(self, space_map: SpaceMap, config: Dict):
         self.space_map = space_map
         self.config = config
+        self._adj: Dict[str, List[Tuple[str, float, int, Route]]] = {}
+        self._route_index: Dict[Tuple[str, str], Route] = {}
+        # SpaceMap.routes_version con la que se construyó el índice
+        self._indexed_version = -1
+        self._sp_cache: Dict[Tuple[str, str, frozenset], Tuple[Optional[List[Star]], float]] = {}
+        self._ksp_cache: Dict[Tuple[str, str, int, frozenset], List[List[Star]]] = {}
+        # Conjunto de bloqueos al que corresponden las entradas de los cachés
+        self._cached_blocked_key: Optional[frozenset] = None
+        # Grafo en formato CSR para el núcleo compilado (numba)
+        self._csr: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+        self._csr_key: Optional[Tuple[int, frozenset]] = None
+        self._csr_ids: List[str] = []
+        self._csr_pos: Dict[str, int] = {}
+        self._build_graph_index()
+    
+    def _build_graph_index(self):
+        """Construye la lista de adyacencia y el índice (a, b) -> Route en una sola pasada."""
+        adj: Dict[str, List[Tuple[str, float, int, Route]]] = {star_id: [] for star_id in self.space_map.stars}
+        route_index: Dict[Tuple[str, str], Route] = {}
+        for route in self.space_map.routes:
+            a = route.from_star.id
+            b = route.to_star.id
+            adj.setdefault(a, []).append((b, route.distance, route.danger_level, route))
+            adj.setdefault(b, []).append((a, route.distance, route.danger_level, route))
+            route_index[(a, b)] = route
+            route_index[(b, a)] = route
+        self._adj = adj
+        self._route_index = route_index
+        self._indexed_version = self.space_map.routes_version
+        # Distancias o rutas distintas: los caminos memorizados y el CSR ya no valen
+        self.clear_path_cache()
+        self._csr_key = None
+        # Lista de estrellas reutilizable (evita copiar el dict en cada consulta)
+        self._all_stars: Tuple[Star, ...] = tuple(self.space_map.get_all_stars_list())
+        self._num_stars = len(self._all_stars)
+    
+    def _ensure_graph_index(self):
+        """Reconstruye el índice si cambiaron las rutas del mapa (SpaceMap.routes_version).
+        
+        El estado ``blocked`` se lee directamente de cada Route, por lo que
+        agregar o remover cometas no requiere reconstruir el índice.
+        """
+        if self._indexed_version != self.space_map.routes_version:
+            self._build_graph_index()
+    
+    def get_route_between(self, a: Star, b: Star) -> Optional[Route]:
+        """Obtiene la ruta que conecta dos estrellas (en cualquier sentido)."""
+        self._ensure_graph_index()
+        return self._route_index.get((a.id, b.id))
+    
+    def _blocked_key(self) -> frozenset:
+        """
+        Identifica el conjunto actual de rutas bloqueadas (clave del caché).
+        
+        Si cambió desde la última consulta (cometas añadidos o quitados), las
+        entradas memorizadas para el conjunto anterior se descartan.
+        """
+        key = frozenset((r.from_star.id, r.to_star.id) for r in self.space_map.routes if r.blocked)
+        if key != self._cached_blocked_key:
+            self.clear_path_cache()
+            self._cached_blocked_key = key
+        return key
+    
+    def clear_path_cache(self):
+        """Descarta los caminos memorizados (p. ej. tras cambios de cometas)."""
+        self._sp_cache.clear()
+        self._ksp_cache.clear()
     
     def dijkstra(self, start: Star, end: Star) -> Tuple[Optional[List[Star]], float]:
+        """Camino de menor costo entre dos estrellas, memorizado por (origen, destino, bloqueos)."""
+        if start.id == end.id:
+            # Trayecto trivial: ni búsqueda ni clave de bloqueos
+            return [start], 0
+        self._ensure_graph_index()
+        key = (start.id, end.id, self._blocked_key())
+        cached = self._sp_cache.get(key)
+        if cached is None:
+            cached = self._dijkstra_search(start, end)
+            self._sp_cache[key] = cached
+        path, cost = cached
+        return (list(path) if path is not None else None), cost
+    
+    def _build_csr(self, blocked_key: frozenset):
+        """Convierte la lista de adyacencia (sin rutas bloqueadas) a arreglos CSR."""
+        ids = list(self._adj)
+        pos = {star_id: i for i, star_id in enumerate(ids)}
+        indptr = np.zeros(len(ids) + 1, dtype=np.int64)
+        indices = []
+        weights = []
+        for i, star_id in enumerate(ids):
+            for neighbor_id, dist, danger, route in self._adj[star_id]:
+                if route.blocked:
+                    continue
+                indices.append(pos[neighbor_id])
+                weights.append(dist + danger * 10)
+            indptr[i + 1] = len(indices)
+        self._csr = (indptr, np.array(indices, dtype=np.int64), np.array(weights, dtype=np.float64))
+        self._csr_ids = ids
+        self._csr_pos = pos
+        self._csr_key = (self.space_map.routes_version, blocked_key)
+    
+    def _ensure_csr(self):
+        """Reconstruye el CSR si cambiaron las rutas o el conjunto de bloqueos."""
+        self._ensure_graph_index()
+        key = (self.space_map.routes_version, self._blocked_key())
+        if self._csr_key != key:
+            self._build_csr(key[1])
+    
+    def _dijkstra_native(self, start: Star, end: Star) -> Tuple[Optional[List[Star]], float]:
+        """Ejecuta el núcleo compilado: id -> índice, búsqueda CSR, índices -> Star."""
+        self._ensure_csr()
+        if start.id not in self._csr_pos or end.id not in self._csr_pos:
+            return None, float('inf')
+        if start.id == end.id:
+            return [start], 0
+        indptr, indices, weights = self._csr
+        prev, cost = _dijkstra_core_native(indptr, indices, weights,
+                                           self._csr_pos[start.id], self._csr_pos[end.id])
+        if cost == float('inf'):
+            return None, float('inf')
+        path = []
+        node = self._csr_pos[end.id]
+        while node != -1:
+            path.append(self.space_map.get_star(self._csr_ids[node]))
+            node = prev[node]
+        path.reverse()
+        return path, float(cost)
+    
+    def _dijkstra_search(self, start: Star, end: Star,
+                         excluded_routes: Optional[Set[int]] = None,
+                         excluded_nodes: Optional[Set[str]] = None) -> Tuple[Optional[List[Star]], float]:
+        """
+        Búsqueda punto a punto sobre la lista de adyacencia.
+        
+        Las exclusiones son locales a la llamada (ids de objetos Route y IDs de
+        estrellas), de modo que nunca se modifica ``route.blocked`` del mapa.
+        Sin exclusiones y con numba instalado se usa el núcleo compilado.
+        """
+        if not excluded_routes and not excluded_nodes and _get_native_core() is not None:
+            return self._dijkstra_native(start, end)
+        excluded_routes = excluded_routes or ()
+        excluded_nodes = excluded_nodes or ()
+        adj = self._adj
+        inf = float('inf')
         pq = [(0, start.id)]
-        distances = {star.id: float('inf') for star in self.space_map.get_all_stars_list()}
-        distances[start.id] = 0
-        previous = {star.id: None for star in self.space_map.get_all_stars_list()}
+        distances = {start.id: 0}
+        previous = {}
         visited = set()
         while pq:
             current_cost, current_id = heapq.heappop(pq)
@@ -46,27 +247,220 @@ class RouteCalculator:
                 continue
             visited.add(current_id)
             if current_id == end.id:
-                path = []
-                current = end.id
-                while current is not None:
-                    path.append(self.space_map.get_star(current))
-                    current = previous[current]
-                path.reverse()
-                return path, distances[end.id]
-            current_star = self.space_map.get_star(current_id)
-            for route in self.space_map.get_routes_from(current_star):
-                if route.blocked:
+                return self._reconstruct_path(previous, end.id), distances[end.id]
+            for neighbor_id, dist, danger, route in adj.get(current_id, ()):
+                if route.blocked or neighbor_id in visited:
                     continue
-                neighbor = route.to_star if route.from_star == current_star else route.from_star
-                if neighbor.id in visited:
+                if neighbor_id in excluded_nodes or id(route) in excluded_routes:
                     continue
-                edge_cost = route.distance + (route.danger_level * 10)
-                new_cost = current_cost + edge_cost
-                if new_cost < distances[neighbor.id]:
-                    distances[neighbor.id] = new_cost
-                    previous[neighbor.id] = current_id
-                    heapq.heappush(pq, (new_cost, neighbor.id))
-        return None, float('inf')
+                new_cost = current_cost + dist + danger * 10
+                if new_cost < distances.get(neighbor_id, inf):
+                    distances[neighbor_id] = new_cost
+                    previous[neighbor_id] = current_id
+                    heapq.heappush(pq, (new_cost, neighbor_id))
+        return None, inf
+    
+    def dijkstra_all(self, start: Star) -> Tuple[Dict[str, float], Dict[str, str]]:
+        """
+        Dijkstra de origen único: costos y predecesores de todas las estrellas alcanzables.
+        
+        Returns:
+            Tupla (distances, previous) indexada por ID de estrella
+        """
+        self._ensure_graph_index()
+        adj = self._adj
+        inf = float('inf')
+        pq = [(0, start.id)]
+        distances = {start.id: 0}
+        previous = {}
+        visited = set()
+        while pq:
+            current_cost, current_id = heapq.heappop(pq)
+            if current_id in visited:
+                continue
+            visited.add(current_id)
+            for neighbor_id, dist, danger, route in adj.get(current_id, ()):
+                if route.blocked or neighbor_id in visited:
+                    continue
+                new_cost = current_cost + dist + danger * 10
+                if new_cost < distances.get(neighbor_id, inf):
+                    distances[neighbor_id] = new_cost
+                    previous[neighbor_id] = current_id
+                    heapq.heappush(pq, (new_cost, neighbor_id))
+        return distances, previous
+    
+    def dijkstra_delta_step(self, start: Star, delta: Optional[float] = None) -> Dict[str, float]:
+        """
+        SSSP por delta-stepping sobre el CSR: cada cubeta de ancho delta se relaja
+        en bloque con NumPy (np.minimum.at) en lugar de una operación de heap por arista.
+        
+        Args:
+            start: Estrella de origen
+            delta: Ancho de cubeta; por defecto el peso medio de las aristas
+            
+        Returns:
+            Costos mínimos de las estrellas alcanzables, indexados por ID
+        """
+        self._ensure_csr()
+        if start.id not in self._csr_pos:
+            return {}
+        indptr, indices, weights = self._csr
+        if delta is None:
+            delta = float(weights.mean()) if len(weights) else 1.0
+        delta = max(delta, 1e-9)
+        n = len(self._csr_ids)
+        dist = np.full(n, np.inf)
+        settled = np.zeros(n, dtype=np.bool_)
+        dist[self._csr_pos[start.id]] = 0.0
+        while True:
+            pending = ~settled & np.isfinite(dist)
+            if not pending.any():
+                break
+            bucket_of = np.floor(dist / delta)
+            current = bucket_of[pending].min()
+            frontier = np.flatnonzero(pending & (bucket_of == current))
+            while len(frontier):
+                # Todas las aristas salientes de la frontera en un solo bloque
+                starts = indptr[frontier]
+                counts = indptr[frontier + 1] - starts
+                total = int(counts.sum())
+                if total == 0:
+                    break
+                offsets = np.cumsum(counts) - counts
+                edge_idx = np.arange(total) - np.repeat(offsets, counts) + np.repeat(starts, counts)
+                src = np.repeat(frontier, counts)
+                dst = indices[edge_idx]
+                before = dist.copy()
+                np.minimum.at(dist, dst, dist[src] + weights[edge_idx])
+                improved = dist < before
+                # Las mejoras que caen en la cubeta actual se vuelven a relajar
+                frontier = np.flatnonzero(improved & (np.floor(dist / delta) == current))
+            settled |= np.isfinite(dist) & (np.floor(dist / delta) <= current)
+        return {self._csr_ids[i]: float(dist[i]) for i in np.flatnonzero(np.isfinite(dist))}
+    
+    def dijkstra_dial(self, start: Star, end: Optional[Star] = None,
+                      max_edge_cost: Optional[int] = None,
+                      edge_cost: Optional[Callable[[Route], int]] = None) -> Tuple[Dict[str, int], Dict[str, str]]:
+        """
+        Dijkstra con cola de cubetas (algoritmo de Dial) para costos enteros pequeños.
+        
+        Con costos acotados por C basta un arreglo circular de C + 1 cubetas:
+        cada extracción es O(1) en lugar de O(log V) con heapq.
+        
+        Args:
+            start: Estrella de origen
+            end: Estrella destino opcional (la búsqueda se detiene al extraerla)
+            max_edge_cost: Cota superior de los costos; si es None se calcula
+            edge_cost: Función Route -> costo entero >= 0 (por defecto distancia + peligro*10)
+            
+        Returns:
+            Tupla (distances, previous) de las estrellas alcanzadas
+        """
+        self._ensure_graph_index()
+        if edge_cost is None:
+            edge_cost = lambda route: int(route.distance + route.danger_level * 10)
+        adj = self._adj
+        if max_edge_cost is None:
+            max_edge_cost = max((edge_cost(r) for r in self.space_map.routes if not r.blocked), default=0)
+        num_buckets = max_edge_cost + 1
+        buckets = [deque() for _ in range(num_buckets)]
+        buckets[0].append(start.id)
+        distances = {start.id: 0}
+        previous = {}
+        visited = set()
+        pending = 1
+        current_cost = 0
+        while pending:
+            bucket = buckets[current_cost % num_buckets]
+            if not bucket:
+                current_cost += 1
+                continue
+            current_id = bucket.popleft()
+            pending -= 1
+            if current_id in visited or distances[current_id] != current_cost:
+                continue
+            visited.add(current_id)
+            if end is not None and current_id == end.id:
+                break
+            for neighbor_id, _, _, route in adj.get(current_id, ()):
+                if route.blocked or neighbor_id in visited:
+                    continue
+                cost = edge_cost(route)
+                if cost < 0 or cost > max_edge_cost:
+                    raise ValueError(f"Costo de arista fuera de rango [0, {max_edge_cost}]: {cost}")
+                new_cost = current_cost + cost
+                if new_cost < distances.get(neighbor_id, new_cost + 1):
+                    distances[neighbor_id] = new_cost
+                    previous[neighbor_id] = current_id
+                    buckets[new_cost % num_buckets].append(neighbor_id)
+                    pending += 1
+        return distances, previous
+    
+    def yen_k_shortest(self, origin: Star, destination: Star, k: int = 3) -> List[List[Star]]:
+        """
+        K caminos más cortos sin ciclos (algoritmo de Yen).
+        
+        Cada desvío reutiliza el prefijo del camino anterior y excluye localmente
+        las aristas ya usadas por ese prefijo, sin tocar el estado compartido del mapa.
+        Los resultados se memorizan por (origen, destino, k, rutas bloqueadas).
+        """
+        self._ensure_graph_index()
+        key = (origin.id, destination.id, k, self._blocked_key())
+        cached = self._ksp_cache.get(key)
+        if cached is not None:
+            return [list(path) for path in cached]
+        
+        first_path, first_cost = self.dijkstra(origin, destination)
+        if not first_path or k <= 0:
+            self._ksp_cache[key] = []
+            return []
+        
+        def edge_cost(a: Star, b: Star) -> float:
+            route = self._route_index[(a.id, b.id)]
+            return route.distance + route.danger_level * 10
+        
+        accepted: List[List[Star]] = [first_path]
+        candidates: List[Tuple[float, int, List[Star]]] = []
+        seen = {tuple(s.id for s in first_path)}
+        counter = 0
+        while len(accepted) < k:
+            previous_path = accepted[-1]
+            root_cost = 0.0
+            for i in range(len(previous_path) - 1):
+                spur_star = previous_path[i]
+                root = previous_path[:i + 1]
+                excluded_routes = set()
+                for path in accepted:
+                    if len(path) > i + 1 and path[:i + 1] == root:
+                        excluded_routes.add(id(self._route_index[(path[i].id, path[i + 1].id)]))
+                excluded_nodes = {star.id for star in root[:-1]}
+                spur_path, spur_cost = self._dijkstra_search(
+                    spur_star, destination, excluded_routes, excluded_nodes)
+                if spur_path:
+                    total_path = root[:-1] + spur_path
+                    path_key = tuple(s.id for s in total_path)
+                    if path_key not in seen:
+                        seen.add(path_key)
+                        counter += 1
+                        heapq.heappush(candidates, (root_cost + spur_cost, counter, total_path))
+                root_cost += edge_cost(previous_path[i], previous_path[i + 1])
+            if not candidates:
+                break
+            _, _, next_path = heapq.heappop(candidates)
+            accepted.append(next_path)
+        
+        self._ksp_cache[key] = accepted
+        return [list(path) for path in accepted]
+    
+    def _reconstruct_path(self, previous: Dict[str, str], end_id: str) -> List[Star]:
+        """Reconstruye el camino siguiendo los predecesores hasta el origen."""
+        path = []
+        current = end_id
+        while current is not None:
+            path.append(self.space_map.get_star(current))
+            current = previous.get(current)
+        path.reverse()
+        return path
     
     def calculate_path_stats(self, path: List[Star]) -> Dict:
         if not path or len(path) < 2:
@@ -79,7 +473,7 @@ class RouteCalculator:
                 'total_grass_needed': 0
             }
         total_distance, total_danger = get_route_and_stats(self.space_map, path)
-        total_energy_for_eating, total_grass_needed = get_energy_and_grass(path)
+        total_energy_for_eating, total_grass_needed = get_energy_and_grass(path, self.space_map.star_arrays)
         return {
             'total_distance': round(total_distance, 2),
             'total_danger': total_danger,
@@ -92,12 +486,17 @@ class RouteCalculator:
         }
     
     def find_all_reachable_stars(self, start: Star, max_distance: float) -> List[Tuple[Star, float]]:
+        self._ensure_graph_index()
+        if self._num_stars >= DELTA_STEP_MIN_STARS:
+            distances = self.dijkstra_delta_step(start)
+        else:
+            distances, _ = self.dijkstra_all(start)
         reachable = []
-        for star in self.space_map.get_all_stars_list():
+        for star in self._all_stars:
             if star == start:
                 continue
-            path, cost = self.dijkstra(start, star)
-            if path and cost <= max_distance:
+            cost = distances.get(star.id)
+            if cost is not None and cost <= max_distance:
                 reachable.append((star, cost))
         reachable.sort(key=lambda x: x[1])
         return reachable
@@ -111,28 +510,28 @@ class RouteCalculator:
         while current_energy > 10 and current_grass > 5:
             best_star = None
             best_benefit = -1
-            for star in self.space_map.get_all_stars_list():
-                if star.id in visited:
-                    continue
-                path, cost = self.dijkstra(current_star, star)
-                if not path:
+            best_travel = 0.0
+            # Un solo Dijkstra por paso: todos los candidatos comparten el origen
+            distances, previous = self.dijkstra_all(current_star)
+            for star in self._all_stars:
+                if star.id in visited or star.id not in distances:
                     continue
-                travel_energy = sum(route.distance for route in self.space_map.routes 
-                                  if self._route_in_path(route, path)) * 0.1
                 eating_benefit = star.amount_of_energy * 10
                 grass_cost = star.time_to_eat * 5
+                # El viaje nunca suma beneficio: descartar antes de reconstruir el camino
+                if current_grass < grass_cost or eating_benefit <= best_benefit:
+                    continue
+                path = self._reconstruct_path(previous, star.id)
+                travel_energy = self._path_distance(path) * 0.1
                 net_benefit = eating_benefit - travel_energy
                 if (current_energy > travel_energy + 10 and 
-                    current_grass >= grass_cost and 
                     net_benefit > best_benefit):
                     best_benefit = net_benefit
                     best_star = star
+                    best_travel = travel_energy
             if best_star is None:
                 break
-            path, _ = self.dijkstra(current_star, best_star)
-            travel_cost = sum(route.distance for route in self.space_map.routes 
-                            if self._route_in_path(route, path)) * 0.1
-            current_energy -= travel_cost
+            current_energy -= best_travel
             current_energy += best_star.amount_of_energy * 10
             current_grass -= best_star.time_to_eat * 5
             eating_sequence.append(best_star)
@@ -140,16 +539,21 @@ class RouteCalculator:
             current_star = best_star
         return eating_sequence
     
-    def _route_in_path(self, route, path: List[Star]) -> bool:
-        for i in range(len(path) - 1):
-            current_star = path[i]
-            next_star = path[i + 1]
-            if ((route.from_star == current_star and route.to_star == next_star) or
-                (route.to_star == current_star and route.from_star == next_star)):
-                return True
-        return False
+    def _path_distance(self, path: List[Star]) -> float:
+        """Suma la distancia de las rutas que forman el camino usando el índice de rutas."""
+        self._ensure_graph_index()
+        total = 0.0
+        seen = set()
+        route_index = self._route_index
+        for a, b in zip(path, path[1:]):
+            route = route_index.get((a.id, b.id))
+            if route is not None and id(route) not in seen:
+                seen.add(id(route))
+                total += route.distance
+        return total
     
-    def find_max_visit_route_from_json(self, start: Star, config_path: str = "data/spaceship_config.json") -> Tuple[List[Star], Dict]:
+    def find_max_visit_route_from_json(self, start: Star, config_path: str = "data/spaceship_config.json",
+                                       beam_width: int = 32) -> Tuple[List[Star], Dict]:
         edad = self.space_map.burro_data['startAge']
         energia_pct = self.space_map.burro_data['burroenergiaInicial'] 
         pasto_kg = self.space_map.burro_data['pasto']
@@ -183,64 +587,99 @@ class RouteCalculator:
             energy_cost = int(distance * 0.1 * age_factor)
             travel_time = distance_to_time(distance)
             return energy_cost, travel_time
-        adjacency: Dict[str, List[Tuple[Route, str]]] = {}
+        adjacency: Dict[str, List[Tuple[Route, str, int]]] = {}
         for route in self.space_map.routes:
             if route.blocked:
                 continue
             a = route.from_star.id
             b = route.to_star.id
-            adjacency.setdefault(a, []).append((route, b))
-            adjacency.setdefault(b, []).append((route, a))
+            adjacency.setdefault(a, []).append((route, b, len(adjacency[a])))
+            adjacency.setdefault(b, []).append((route, a, len(adjacency[b])))
+        # Vecinos por distancia ascendente: costo y tiempo crecen con la distancia y el
+        # puntaje decrece, así que la expansión puede cortar en cuanto tiene sus ramas.
+        for neighbors_list in adjacency.values():
+            neighbors_list.sort(key=lambda entry: entry[0].distance)
+        # Costos de energía enteros y acotados: SSSP con cubetas (Dial) desde cada
+        # estrella expandida, memorizado, para acotar cuántas estrellas quedan alcanzables.
+        energy_from: Dict[str, Dict[str, int]] = {}
+        def energy_costs_from(star_id: str) -> Dict[str, int]:
+            costs = energy_from.get(star_id)
+            if costs is None:
+                costs, _ = self.dijkstra_dial(
+                    self.space_map.get_star(star_id),
+                    edge_cost=lambda route: edge_cost_and_time(route.distance)[0])
+                energy_from[star_id] = costs
+            return costs
+        # Mejor camino como instantánea de índices de estrella (sin copiar listas de Star)
         best = {
-            'visited': [start],
-            'distance': 0.0
+            'len': 1,
+            'distance': 0.0,
+            'ids': array('i', [start.index])
         }
         def heuristic_score(visited_count: int, remaining_energy: int, remaining_life: float) -> float:
             base_score = visited_count * 1000
             energy_bonus = remaining_energy * 2
             life_bonus = min(remaining_life, 100) * 5
             return base_score + energy_bonus + life_bonus
-        def optimized_search(current_id: str, path: List[Star], total_distance: float, energy_left: int, life_left: float, depth: int = 0):
-            nonlocal best
-            if depth > 12:
-                return
-            if (len(path) > len(best['visited']) or 
-                (len(path) == len(best['visited']) and total_distance < best['distance'])):
-                best['visited'] = path.copy()
-                best['distance'] = total_distance
-            max_additional = min(8, len(self.space_map.get_all_stars_list()) - len(path))
-            if len(path) + max_additional <= len(best['visited']):
-                return
-            neighbors = []
-            for (route, neighbor_id) in adjacency.get(current_id, []):
-                if neighbor_id in {s.id for s in path}:
-                    continue
-                d = route.distance
-                energy_cost, travel_time = edge_cost_and_time(d)
-                if energy_cost > energy_left or travel_time > life_left:
+        # Búsqueda en haz: en cada profundidad se conservan solo los beam_width
+        # caminos parciales con mejor heurística. Cada estado lleva su propio
+        # conjunto de visitadas para no reconstruirlo en cada expansión.
+        max_depth = 12
+        max_branches = 6
+        frontier = [(start.id, (start,), frozenset((start.id,)), 0.0, remaining_energy, remaining_life)]
+        for depth in range(max_depth + 1):
+            children = []
+            for current_id, path, visited_ids, total_distance, energy_left, life_left in frontier:
+                if (len(path) > best['len'] or 
+                    (len(path) == best['len'] and total_distance < best['distance'])):
+                    if len(path) == best['len']:
+                        best['ids'][:] = array('i', (star.index for star in path))
+                    else:
+                        best['ids'] = array('i', (star.index for star in path))
+                    best['len'] = len(path)
+                    best['distance'] = total_distance
+                if depth == max_depth:
                     continue
-                neighbor_star = self.space_map.get_star(neighbor_id)
-                if not neighbor_star:
+                # Cota admisible: estrellas no visitadas alcanzables con la energía restante
+                upper_bound = sum(1 for star_id, cost in energy_costs_from(current_id).items()
+                                  if cost <= energy_left and star_id not in visited_ids)
+                if len(path) + upper_bound <= best['len']:
                     continue
-                new_energy = energy_left - energy_cost
-                new_life = life_left - travel_time
-                score = heuristic_score(len(path) + 1, new_energy, new_life)
-                neighbors.append((score, route, neighbor_id, neighbor_star, energy_cost, travel_time))
-            neighbors.sort(key=lambda x: x[0], reverse=True)
-            max_branches = min(6, len(neighbors))
-            for i in range(max_branches):
-                _, route, neighbor_id, neighbor_star, energy_cost, travel_time = neighbors[i]
-                path.append(neighbor_star)
-                optimized_search(neighbor_id, path, total_distance + route.distance, energy_left - energy_cost, life_left - travel_time, depth + 1)
-                path.pop()
-        optimized_search(start.id, [start], 0.0, remaining_energy, remaining_life)
+                neighbors = []
+                for (route, neighbor_id, position) in adjacency.get(current_id, ()):
+                    if neighbor_id in visited_ids:
+                        continue
+                    d = route.distance
+                    energy_cost, travel_time = edge_cost_and_time(d)
+                    if energy_cost > energy_left or travel_time > life_left:
+                        break  # Los vecinos restantes están más lejos: tampoco son viables
+                    neighbor_star = self.space_map.get_star(neighbor_id)
+                    if not neighbor_star:
+                        continue
+                    new_energy = energy_left - energy_cost
+                    new_life = life_left - travel_time
+                    score = heuristic_score(len(path) + 1, new_energy, new_life)
+                    if len(neighbors) >= max_branches and score < neighbors[max_branches - 1][0]:
+                        break  # Ya hay max_branches con mejor puntaje (se conservan los empates)
+                    neighbors.append((score, -position, neighbor_id, neighbor_star, d, new_energy, new_life))
+                # Empates resueltos por el orden original de la lista de adyacencia
+                for score, _, neighbor_id, neighbor_star, d, new_energy, new_life in heapq.nlargest(
+                        max_branches, neighbors, key=lambda x: (x[0], x[1])):
+                    children.append((score, (neighbor_id, path + (neighbor_star,), visited_ids | {neighbor_id},
+                                             total_distance + d, new_energy, new_life)))
+            if not children:
+                break
+            frontier = [state for _, state in heapq.nlargest(beam_width, children, key=lambda x: x[0])]
+        self._ensure_graph_index()
+        stars_by_index = self._all_stars
+        best_path = [stars_by_index[i] for i in best['ids']]
         total_distance = round(best['distance'], 2)
         life_consumed = round(distance_to_time(best['distance']), 2)
         stats = {
-            'stars_visited': len(best['visited']),
+            'stars_visited': len(best_path),
             'total_distance': total_distance,
             'life_time_consumed': life_consumed,
-            'path_stars': [star.label for star in best['visited']],
+            'path_stars': [star.label for star in best_path],
             'json_values_used': {
                 'energia_inicial': energia_pct,
                 'edad_inicial': edad,
@@ -252,7 +691,7 @@ class RouteCalculator:
             },
             'notes': f'Valores EXCLUSIVAMENTE del JSON: energia={energia_pct}%, edad={edad}, death_age={death_age}, pasto={pasto_kg}kg, salud={estado_salud}'
         }
-        return best['visited'], stats
+        return best_path, stats
 
     def find_min_cost_route_from_json(self, start: Star, config_path: str = "data/spaceship_config.json", research_params=None) -> Tuple[List[Star], Dict]:
         from ..route_tools.min_cost_route import MinCostRouteCalculator
@@ -3,9 +3,15 @@ Sistema de gestión de rutas con impacto de cometas.
 Maneja invalidación, recálculo y búsqueda de alternativas.
 """
 from typing import List, Dict, Optional, Tuple, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from .models import Star, Route, SpaceMap, Comet
 
+# Tipos de viaje registrados en ActiveJourney.journey_type
+JOURNEY_OPTIMAL = "optimal"
+JOURNEY_MAX_VISIT = "max_visit"
+JOURNEY_MIN_COST = "min_cost"
+JOURNEY_UNKNOWN = "unknown"
+
 
 @dataclass
 class RouteImpactResult:
@@ -24,7 +30,9 @@ class ActiveJourney:
     current_position: int  # Índice en planned_path
     origin: Star
     destination: Star
-    journey_type: str  # "optimal", "max_visit", "min_cost"
+    journey_type: str  # JOURNEY_OPTIMAL, JOURNEY_MAX_VISIT, JOURNEY_MIN_COST
+    # Rutas del viaje como bitset (un bit por Route.index)
+    edge_bitmask: int = field(default=0, repr=False)
 
 
 class IRouteValidator:
@@ -50,6 +58,10 @@ class IRouteCalculator:
                                    space_map: SpaceMap, max_alternatives: int = 3) -> List[List[Star]]:
         """Calcula rutas alternativas."""
         raise NotImplementedError
+    
+    def clear_cache(self) -> None:
+        """Descarta resultados memorizados (opcional para implementaciones sin caché)."""
+        pass
 
 
 class RouteValidator(IRouteValidator):
@@ -60,10 +72,7 @@ class RouteValidator(IRouteValidator):
         if not path or len(path) < 2:
             return True  # Ruta vacía o de un solo punto es válida
         
-        for i in range(len(path) - 1):
-            from_star = path[i]
-            to_star = path[i + 1]
-            
+        for from_star, to_star in zip(path, path[1:]):
             # Buscar la ruta entre estas estrellas
             route = self._find_route_between(from_star, to_star, space_map)
             if not route or route.blocked:
@@ -78,10 +87,7 @@ class RouteValidator(IRouteValidator):
         if not path or len(path) < 2:
             return blocked_segments
         
-        for i in range(len(path) - 1):
-            from_star = path[i]
-            to_star = path[i + 1]
-            
+        for from_star, to_star in zip(path, path[1:]):
             route = self._find_route_between(from_star, to_star, space_map)
             if route and route.blocked:
                 blocked_segments.append((from_star.id, to_star.id))
@@ -90,69 +96,46 @@ class RouteValidator(IRouteValidator):
     
     def _find_route_between(self, from_star: Star, to_star: Star, space_map: SpaceMap) -> Optional[Route]:
         """Encuentra la ruta entre dos estrellas."""
-        for route in space_map.routes:
-            if ((route.from_star == from_star and route.to_star == to_star) or
-                (route.from_star == to_star and route.to_star == from_star)):
-                return route
-        return None
+        return space_map.get_route_between(from_star.id, to_star.id)
 
 
 class BasicRouteCalculator(IRouteCalculator):
     """Calculador básico de rutas usando Dijkstra."""
     
+    def __init__(self):
+        self._calculator = None
+    
+    def _get_calculator(self, space_map: SpaceMap):
+        """Reutiliza el RouteCalculator (y su caché) mientras el mapa no cambie."""
+        if self._calculator is None or self._calculator.space_map is not space_map:
+            from ..algorithms.route_calculator import RouteCalculator
+            self._calculator = RouteCalculator(space_map, {})
+        return self._calculator
+    
+    def clear_cache(self) -> None:
+        """Descarta los caminos memorizados por el calculador interno."""
+        if self._calculator is not None:
+            self._calculator.clear_path_cache()
+    
     def calculate_route(self, origin: Star, destination: Star, space_map: SpaceMap) -> Optional[List[Star]]:
         """Calcula una ruta usando el calculador existente."""
         try:
             # Usar el calculador existente del sistema
-            from ..algorithms.route_calculator import RouteCalculator
-            calculator = RouteCalculator(space_map, {})
-            path, _ = calculator.dijkstra(origin, destination)
+            path, _ = self._get_calculator(space_map).dijkstra(origin, destination)
             return path
         except:
             return None
     
     def calculate_alternative_routes(self, origin: Star, destination: Star, 
                                    space_map: SpaceMap, max_alternatives: int = 3) -> List[List[Star]]:
-        """Calcula rutas alternativas bloqueando temporalmente rutas ya encontradas."""
-        alternatives = []
-        blocked_routes_backup = []
+        """Calcula rutas alternativas con el algoritmo de Yen (K caminos más cortos).
         
+        No modifica ``route.blocked``: las aristas se excluyen localmente en cada búsqueda.
+        """
         try:
-            # Encontrar múltiples rutas bloqueando temporalmente las ya encontradas
-            for attempt in range(max_alternatives):
-                path = self.calculate_route(origin, destination, space_map)
-                
-                if path and len(path) > 1:
-                    alternatives.append(path)
-                    
-                    # Bloquear temporalmente esta ruta para encontrar alternativas
-                    routes_to_block = []
-                    for i in range(len(path) - 1):
-                        from_star = path[i]
-                        to_star = path[i + 1]
-                        
-                        for route in space_map.routes:
-                            if ((route.from_star == from_star and route.to_star == to_star) or
-                                (route.from_star == to_star and route.to_star == from_star)):
-                                if not route.blocked:
-                                    route.blocked = True
-                                    routes_to_block.append(route)
-                                    blocked_routes_backup.append(route)
-                                break
-                else:
-                    break  # No más rutas disponibles
-            
-            # Restaurar rutas bloqueadas temporalmente
-            for route in blocked_routes_backup:
-                route.blocked = False
-            
-            return alternatives
-            
+            return self._get_calculator(space_map).yen_k_shortest(origin, destination, max_alternatives)
         except Exception:
-            # Restaurar rutas en caso de error
-            for route in blocked_routes_backup:
-                route.blocked = False
-            return alternatives
+            return []
 
 
 class CometImpactManager:
@@ -168,7 +151,7 @@ class CometImpactManager:
         self.impact_listeners: List[Callable[[RouteImpactResult], None]] = []
     
     def register_active_journey(self, planned_path: List[Star], current_position: int, 
-                               journey_type: str = "unknown") -> None:
+                               journey_type: str = JOURNEY_UNKNOWN) -> None:
         """Registra un viaje activo que puede ser afectado por cometas."""
         if planned_path and len(planned_path) >= 2:
             journey = ActiveJourney(
@@ -176,7 +159,9 @@ class CometImpactManager:
                 current_position=current_position,
                 origin=planned_path[0],
                 destination=planned_path[-1],
-                journey_type=journey_type
+                journey_type=journey_type,
+                edge_bitmask=self.space_map.route_bitmask(
+                    (a.id, b.id) for a, b in zip(planned_path, planned_path[1:]))
             )
             self.active_journeys.append(journey)
     
@@ -194,9 +179,16 @@ class CometImpactManager:
             impact_summary=""
         )
         
+        # El conjunto de rutas bloqueadas cambia: descartar caminos memorizados
+        self.route_calculator.clear_cache()
+        
+        # Alternativas calculadas en este análisis, por (origen, destino)
+        local_alt_cache: Dict[Tuple[str, str], List[List[Star]]] = {}
+        blocked_bitmask = self.space_map.route_bitmask(comet.blocked_routes)
+        
         # Verificar impacto en viajes activos
         for journey in self.active_journeys:
-            if self._journey_affected_by_comet(journey, comet):
+            if self._journey_affected_by_comet(journey, comet, blocked_bitmask):
                 impact_result.path_invalidated = True
                 impact_result.recalculation_needed = True
                 
@@ -205,9 +197,13 @@ class CometImpactManager:
                     journey.planned_path, self.space_map)
                 impact_result.affected_segments.extend(blocked_segments)
                 
-                # Calcular rutas alternativas
-                alternatives = self.route_calculator.calculate_alternative_routes(
-                    journey.origin, journey.destination, self.space_map)
+                # Calcular rutas alternativas (una vez por par origen/destino)
+                endpoints = (journey.origin.id, journey.destination.id)
+                alternatives = local_alt_cache.get(endpoints)
+                if alternatives is None:
+                    alternatives = self.route_calculator.calculate_alternative_routes(
+                        journey.origin, journey.destination, self.space_map)
+                    local_alt_cache[endpoints] = alternatives
                 
                 # Filtrar alternativas válidas (no bloqueadas)
                 valid_alternatives = [alt for alt in alternatives 
@@ -247,18 +243,12 @@ class CometImpactManager:
         """Limpia todos los viajes activos."""
         self.active_journeys.clear()
     
-    def _journey_affected_by_comet(self, journey: ActiveJourney, comet: Comet) -> bool:
-        """Verifica si un viaje es afectado por un cometa."""
-        for from_id, to_id in comet.blocked_routes:
-            # Verificar si algún segmento del viaje usa esta ruta
-            for i in range(len(journey.planned_path) - 1):
-                current_from = journey.planned_path[i].id
-                current_to = journey.planned_path[i + 1].id
-                
-                if ((current_from == from_id and current_to == to_id) or
-                    (current_from == to_id and current_to == from_id)):
-                    return True
-        return False
+    def _journey_affected_by_comet(self, journey: ActiveJourney, comet: Comet,
+                                   blocked_bitmask: Optional[int] = None) -> bool:
+        """Verifica si un viaje es afectado por un cometa (intersección de bitsets)."""
+        if blocked_bitmask is None:
+            blocked_bitmask = self.space_map.route_bitmask(comet.blocked_routes)
+        return bool(journey.edge_bitmask & blocked_bitmask)
     
     def _generate_impact_summary(self, impact_result: RouteImpactResult) -> str:
         """Genera un resumen del impacto."""
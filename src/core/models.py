@@ -1,13 +1,15 @@
 """
 Core classes for the Galaxias space route simulation system.
 """
-import json
+import sys
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass, field
 import math
+import numpy as np
+from ..utils.json_handler import JSONHandler
 
 
-@dataclass
+@dataclass(slots=True)
 class Star:
     """Represents a star in a constellation."""
     id: str
@@ -19,6 +21,7 @@ class Star:
     amount_of_energy: int
     hypergiant: bool
     linked_to: List[Dict] = field(default_factory=list)
+    index: int = field(default=-1, compare=False, repr=False)  # Posición en los arreglos del SpaceMap
     
     def __hash__(self):
         return hash(self.id)
@@ -29,7 +32,7 @@ class Star:
         return False
 
 
-@dataclass
+@dataclass(slots=True)
 class Route:
     """Represents a route between two stars."""
     from_star: Star
@@ -38,6 +41,8 @@ class Route:
     danger_level: int
     blocked: bool = False
     blocked_by_comet: str = ""
+    # Posición en SpaceMap.routes (bit de la ruta en las máscaras de rutas)
+    index: int = field(default=-1, compare=False, repr=False)
     
     def calculate_cost(self, fuel_rate: float, danger_penalty: float) -> float:
         """Calculate the total cost of traveling this route."""
@@ -231,9 +236,7 @@ class BurroAstronauta:
         else:
             # Fallback: usar warp_factor por defecto
             try:
-                import json
-                with open("data/spaceship_config.json", 'r') as f:
-                    config = json.load(f)
+                config = JSONHandler.load_spaceship_config("data/spaceship_config.json")
                 warp_factor = config.get('scientific_parameters', {}).get('warp_factor', 1.0)
                 return distance / warp_factor
             except:
@@ -286,12 +289,25 @@ class SpaceMap:
         self.routes: List[Route] = []
         self.comets: List[Comet] = []
         self.burro_data: Dict = {}
+        # Atributos numéricos en formato columnar (un arreglo por atributo)
+        self.star_arrays: Dict[str, np.ndarray] = {}
+        self.route_arrays: Dict[str, np.ndarray] = {}
+        self.route_positions: Dict[Tuple[str, str], int] = {}
+        # Índice (origen, destino) -> ruta, en ambos sentidos
+        self._route_by_endpoints: Dict[Tuple[str, str], Route] = {}
+        # Índice estrella -> rutas incidentes (orden de self.routes)
+        self._routes_by_star: Dict[str, List[Route]] = {}
+        self._all_star_ids: Tuple[str, ...] = ()
+        # Se incrementa cada vez que cambian las rutas (índices externos la usan de clave)
+        self.routes_version = 0
+        # Textos de las estrellas para los selectores (se formatean al primer uso)
+        self._star_labels: Optional[Tuple[str, ...]] = None
         self.load_data(data_path)
     
     def load_data(self, data_path: str):
         """Load constellation and route data from JSON."""
-        with open(data_path, 'r') as f:
-            data = json.load(f)
+        # Datos compartidos con otras instancias: solo se leen
+        data = JSONHandler.load_json_cached(data_path)
         
         # Load burro data
         self.burro_data = {
@@ -306,7 +322,7 @@ class SpaceMap:
         # Load stars from constellations
         for constellation in data.get('constellations', []):
             for start_data in constellation.get('starts', []):
-                star_id = str(start_data['id'])
+                star_id = sys.intern(str(start_data['id']))
                 star = Star(
                     id=star_id,
                     label=start_data.get('label', star_id),
@@ -316,7 +332,7 @@ class SpaceMap:
                     time_to_eat=int(start_data.get('timeToEat', 1)),
                     amount_of_energy=int(start_data.get('amountOfEnergy', 1)),
                     hypergiant=bool(start_data.get('hypergiant', False)),
-                    linked_to=start_data.get('linkedTo', [])
+                    linked_to=list(start_data.get('linkedTo', []))
                 )
                 self.stars[star_id] = star
 
@@ -324,7 +340,7 @@ class SpaceMap:
         seen_edges = set()
         for star in self.stars.values():
             for link in star.linked_to:
-                to_star_id = str(link['starId'])
+                to_star_id = sys.intern(str(link['starId']))
                 distance = float(link['distance'])
                 
                 edge_key = tuple(sorted((star.id, to_star_id)))
@@ -343,6 +359,51 @@ class SpaceMap:
                         danger_level=danger_level
                     )
                     self.routes.append(route)
+        
+        self._build_arrays()
+    
+    def _build_arrays(self):
+        """Materializa los atributos de estrellas y rutas en arreglos NumPy indexados."""
+        self.routes_version += 1
+        stars = list(self.stars.values())
+        for i, star in enumerate(stars):
+            star.index = i
+        self._all_star_ids = tuple(star.id for star in stars)
+        self._star_labels = None
+        self.star_arrays = {
+            'amount_of_energy': np.array([s.amount_of_energy for s in stars], dtype=np.int64),
+            'time_to_eat': np.array([s.time_to_eat for s in stars], dtype=np.int64),
+            'radius': np.array([s.radius for s in stars], dtype=np.float64),
+            'xy': np.array([(s.x, s.y) for s in stars], dtype=np.float64).reshape(-1, 2)
+        }
+        self.route_arrays = {
+            'distance': np.array([r.distance for r in self.routes], dtype=np.float64),
+            'danger_level': np.array([r.danger_level for r in self.routes], dtype=np.int64),
+            'segments': np.array([((r.from_star.x, r.from_star.y), (r.to_star.x, r.to_star.y))
+                                  for r in self.routes], dtype=np.float64).reshape(-1, 2, 2)
+        }
+        self.route_positions = {}
+        for i, route in enumerate(self.routes):
+            route.index = i
+            self.route_positions[(route.from_star.id, route.to_star.id)] = i
+            self.route_positions[(route.to_star.id, route.from_star.id)] = i
+        self._route_by_endpoints = {}
+        self._routes_by_star = {}
+        for route in self.routes:
+            self._route_by_endpoints.setdefault((route.from_star.id, route.to_star.id), route)
+            self._route_by_endpoints.setdefault((route.to_star.id, route.from_star.id), route)
+            self._routes_by_star.setdefault(route.from_star.id, []).append(route)
+            if route.to_star.id != route.from_star.id:
+                self._routes_by_star.setdefault(route.to_star.id, []).append(route)
+    
+    def mark_routes_changed(self):
+        """
+        Rebuild the derived route data after routes were edited in place
+        (distance, danger level) or the routes list was replaced.
+        
+        Comet blocking does not need this: ``blocked`` is read live.
+        """
+        self._build_arrays()
     
     def _calculate_danger_level(self, distance: float) -> int:
         """Calculate danger level based on distance."""
@@ -359,9 +420,27 @@ class SpaceMap:
         """Get a star by its ID."""
         return self.stars.get(str(star_id))
     
+    def get_route_between(self, from_id: str, to_id: str) -> Optional[Route]:
+        """Get the route connecting two stars (in either direction), if any."""
+        return self._route_by_endpoints.get((from_id, to_id))
+    
+    def route_distance(self, from_id: str, to_id: str, default: float = 0.0) -> float:
+        """Distance of the route connecting two stars (either direction), or default."""
+        route = self._route_by_endpoints.get((from_id, to_id))
+        return route.distance if route is not None else default
+    
+    def route_bitmask(self, pairs) -> int:
+        """Build an int bitset with one bit (route.index) per known route in pairs."""
+        mask = 0
+        for from_id, to_id in pairs:
+            route = self._route_by_endpoints.get((from_id, to_id))
+            if route is not None:
+                mask |= 1 << route.index
+        return mask
+    
     def get_routes_from(self, star: Star) -> List[Route]:
         """Get all routes starting from or ending at a given star."""
-        return [r for r in self.routes if r.from_star == star or r.to_star == star]
+        return list(self._routes_by_star.get(star.id, ()))
     
     def add_comet(self, comet: Comet):
         """Add a comet that blocks certain routes."""
@@ -392,6 +471,18 @@ class SpaceMap:
         """Get a list of all stars."""
         return list(self.stars.values())
     
+    def get_all_star_ids(self) -> Tuple[str, ...]:
+        """Get the IDs of all stars, in map order (cached at load time)."""
+        return self._all_star_ids
+    
+    @property
+    def star_labels(self) -> Tuple[str, ...]:
+        """Display texts of all stars, in map order (memoized until the stars change)."""
+        if self._star_labels is None:
+            self._star_labels = tuple(f"{s.label} ({s.id}) - E:{s.amount_of_energy}"
+                                      for s in self.stars.values())
+        return self._star_labels
+    
     def create_burro_astronauta(self, name: str = "Burro Astronauta") -> 'BurroAstronauta':
         """Create a BurroAstronauta instance with data from JSON."""
         return BurroAstronauta(
@@ -414,8 +505,7 @@ class SpaceMap:
         # Recopilar todos los enlaces existentes desde el JSON original
         enlaces_existentes = set()
         
-        with open('data/constellations.json', 'r') as f:
-            data = json.load(f)
+        data = JSONHandler.load_json_cached('data/constellations.json')
         
         for constellation in data.get('constellations', []):
             for star_data in constellation.get('starts', []):
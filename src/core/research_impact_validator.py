@@ -11,6 +11,12 @@ from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 import json
 
+# Máximo de impactos de ruta memorizados por el validador
+ROUTE_IMPACT_CACHE_SIZE = 64
+
+# Espera para agrupar los cambios de los sliders mientras se arrastran (ms)
+IMPACT_CHANGE_DELAY_MS = 50
+
 
 @dataclass
 class StarResearchImpact:
@@ -80,6 +86,10 @@ class ResearchImpactValidator:
         """
         self.space_map = space_map
         self.star_impacts: Dict[str, StarResearchImpact] = {}
+        # Versión de la configuración: aumenta cada vez que cambia algún impacto
+        self._config_version = 0
+        # Impactos de ruta ya calculados, por (tupla de IDs, versión de configuración)
+        self._route_impact_cache: Dict[Tuple[Tuple[str, ...], int], Dict] = {}
         self._initialize_default_impacts()
     
     def _initialize_default_impacts(self):
@@ -98,7 +108,10 @@ class ResearchImpactValidator:
     
     def update_star_impact(self, star_id: str, impact: StarResearchImpact):
         """Actualiza el impacto para una estrella."""
+        if self.star_impacts.get(star_id) == impact:
+            return
         self.star_impacts[star_id] = impact
+        self._config_version += 1
     
     def calculate_route_impact(self, star_ids: List[str]) -> Dict:
         """
@@ -110,6 +123,17 @@ class ResearchImpactValidator:
         Returns:
             Diccionario con impactos totales calculados
         """
+        key = (tuple(star_ids), self._config_version)
+        cached = self._route_impact_cache.get(key)
+        if cached is None:
+            if len(self._route_impact_cache) >= ROUTE_IMPACT_CACHE_SIZE:
+                # Descartar la entrada más antigua (normalmente de una versión previa)
+                del self._route_impact_cache[next(iter(self._route_impact_cache))]
+            cached = self._route_impact_cache[key] = self._compute_route_impact(star_ids)
+        return cached
+    
+    def _compute_route_impact(self, star_ids: List[str]) -> Dict:
+        """Suma los impactos de las estrellas de la ruta."""
         total_health_delta = 0.0
         total_life_delta = 0.0
         total_energy_multiplier = 1.0
@@ -178,6 +202,7 @@ class ResearchImpactValidator:
         try:
             config = json.loads(json_config)
             impacts = config.get('research_impacts', {})
+            self._config_version += 1
             
             for star_id, impact_data in impacts.items():
                 if star_id in self.star_impacts:
@@ -209,6 +234,8 @@ class ResearchImpactValidatorGUI:
         self.space_map = space_map
         self.validator = ResearchImpactValidator(space_map)
         self.result = None
+        # Aplicación pendiente de los sliders (id de after) o None
+        self._impact_change_job = None
         
         # Crear ventana
         self.window = tk.Toplevel(parent)
@@ -254,12 +281,15 @@ class ResearchImpactValidatorGUI:
                                       selectbackground='#0066AA')
         self.star_listbox.pack(padx=10, pady=5, fill=tk.BOTH, expand=True)
         
-        # Poblar lista de estrellas
+        # Poblar lista de estrellas (una sola inserción)
+        entries = []
         for star in self.space_map.get_all_stars_list():
             display_text = f"{star.label} (ID:{star.id})"
             if star.hypergiant:
                 display_text += " ⭐"
-            self.star_listbox.insert(tk.END, display_text)
+            entries.append(display_text)
+        if entries:
+            self.star_listbox.insert(tk.END, *entries)
         
         self.star_listbox.bind('<<ListboxSelect>>', self.on_star_select)
         
@@ -421,6 +451,7 @@ class ResearchImpactValidatorGUI:
     
     def load_star_config(self, star):
         """Carga la configuración de una estrella en los controles."""
+        self._flush_impact_change()
         impact = self.validator.get_star_impact(star.id)
         if impact:
             self.star_info_label.config(
@@ -438,11 +469,29 @@ class ResearchImpactValidatorGUI:
             self.update_impact_summary()
     
     def on_impact_change(self, value=None):
-        """Maneja cambios en los controles de impacto."""
-        if hasattr(self, 'current_star'):
+        """
+        Maneja cambios en los controles de impacto.
+        
+        Los movimientos de un slider se agrupan: el impacto y el resumen se
+        recalculan como mucho una vez cada IMPACT_CHANGE_DELAY_MS.
+        """
+        if self._impact_change_job is None:
+            self._impact_change_job = self.window.after(IMPACT_CHANGE_DELAY_MS,
+                                                        self._apply_impact_change)
+    
+    def _apply_impact_change(self):
+        """Aplica el último valor de los sliders a la estrella actual."""
+        self._impact_change_job = None
+        if hasattr(self, 'current_star') and self.window.winfo_exists():
             self.update_star_impact()
             self.update_impact_summary()
     
+    def _flush_impact_change(self):
+        """Aplica ya un cambio de sliders pendiente (antes de leer el validador)."""
+        if self._impact_change_job is not None:
+            self.window.after_cancel(self._impact_change_job)
+            self._apply_impact_change()
+    
     def update_star_impact(self):
         """Actualiza el impacto de la estrella actual."""
         if hasattr(self, 'current_star'):
@@ -478,13 +527,13 @@ class ResearchImpactValidatorGUI:
                     f"   Vida = {impact.life_time_impact:.1f} × factor = {impact.final_life_delta:+.1f}\n"
                 )
                 
-                self.impact_summary.delete('1.0', tk.END)
-                self.impact_summary.insert('1.0', summary)
+                self.impact_summary.replace('1.0', tk.END, summary)
     
     def validate_current_route(self):
         """Valida el impacto de la ruta actual."""
+        self._flush_impact_change()
         # Obtener estrellas seleccionadas (simplificado para demo)
-        all_stars = [star.id for star in self.space_map.get_all_stars_list()]
+        all_stars = self.space_map.get_all_star_ids()
         route_impact = self.validator.calculate_route_impact(all_stars)
         
         message = (
@@ -497,14 +546,15 @@ class ResearchImpactValidatorGUI:
         )
         
         if route_impact['risk_stars']:
-            message += "🚨 ESTRELLAS DE RIESGO:\n"
-            for risk_star in route_impact['risk_stars']:
-                message += f"   • {risk_star['star']} ({risk_star['risk']})\n"
+            message += "🚨 ESTRELLAS DE RIESGO:\n" + "".join(
+                f"   • {risk_star['star']} ({risk_star['risk']})\n"
+                for risk_star in route_impact['risk_stars'])
         
         messagebox.showinfo("Validación de Ruta", message)
     
     def export_config(self):
         """Exporta la configuración actual."""
+        self._flush_impact_change()
         config_json = self.validator.export_configuration()
         
         # Crear ventana para mostrar JSON
@@ -542,11 +592,15 @@ class ResearchImpactValidatorGUI:
     
     def apply_and_close(self):
         """Aplica los cambios y cierra la ventana."""
+        self._flush_impact_change()
         self.result = self.validator
         self.window.destroy()
     
     def cancel(self):
         """Cancela sin aplicar cambios."""
+        if self._impact_change_job is not None:
+            self.window.after_cancel(self._impact_change_job)
+            self._impact_change_job = None
         self.result = None
         self.window.destroy()
     
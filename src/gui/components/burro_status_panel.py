@@ -7,6 +7,7 @@ from tkinter import scrolledtext, messagebox
 from typing import Callable, Optional, Dict, Any
 from ...core import BurroAstronauta
 from ..interfaces.component_interface import IComponent
+from .styles import LABEL_FRAME_STYLE, ACTION_BUTTON_STYLE
 
 
 class BurroStatusPanel(IComponent):
@@ -16,16 +17,15 @@ class BurroStatusPanel(IComponent):
         self.burro = burro
         self.frame = None
         self.status_text = None
+        # Último estado escrito; None si el widget cambió por otra vía (mensajes)
+        self._last_status: Optional[str] = None
         
         # Callbacks
         self.on_restore_resources: Optional[Callable] = None
     
     def create_widgets(self, parent: tk.Widget) -> tk.Widget:
         """Create and return the burro status widgets."""
-        self.frame = tk.LabelFrame(parent, text="Estado del Burro Astronauta",
-                                  font=('Arial', 12, 'bold'),
-                                  bg='#000066', fg='white',
-                                  relief=tk.GROOVE, borderwidth=2)
+        self.frame = tk.LabelFrame(parent, text="Estado del Burro Astronauta", **LABEL_FRAME_STYLE)
         
         self.status_text = scrolledtext.ScrolledText(self.frame, height=10, width=35,
                                                      bg='#000033', fg='white',
@@ -35,8 +35,8 @@ class BurroStatusPanel(IComponent):
         # Restore resources button
         tk.Button(self.frame, text="Restaurar Recursos",
                  command=self._handle_restore_resources,
-                 bg='#FFAA44', fg='black', font=('Arial', 10, 'bold'),
-                 relief=tk.RAISED, borderwidth=2).pack(pady=5)
+                 bg='#FFAA44', fg='black',
+                 **ACTION_BUTTON_STYLE).pack(pady=5)
         
         return self.frame
     
@@ -50,9 +50,26 @@ class BurroStatusPanel(IComponent):
         if not self.status_text:
             return
             
-        status = self.burro.get_status()
+        status_str = self._format_status(self.burro.get_status())
+        # Sin cambios visibles: no se toca el widget (evita el reflow del Text)
+        if status_str == self._last_status:
+            return
         
-        status_str = f"""
+        previous = self._last_status
+        new_lines = status_str.split('\n')
+        if previous is not None and previous.count('\n') == len(new_lines) - 1:
+            # Mismo formato: solo se reescriben las líneas que cambiaron
+            for number, (old_line, new_line) in enumerate(zip(previous.split('\n'), new_lines), 1):
+                if old_line != new_line:
+                    self.status_text.replace(f'{number}.0', f'{number}.end', new_line)
+        else:
+            self.status_text.replace('1.0', tk.END, status_str)
+        self._last_status = status_str
+    
+    @staticmethod
+    def _format_status(status: Dict[str, Any]) -> str:
+        """Render the status dict as the panel text."""
+        return f"""
 {'='*30}
 BURRO ASTRONAUTA
 {'='*30}
@@ -80,17 +97,16 @@ DATOS JSON:
   BurroEnergía:    {status['energia']}%
   Estado Salud:    {status['estado_salud']}
         """
-        
-        self.status_text.delete(1.0, tk.END)
-        self.status_text.insert(1.0, status_str)
     
     def append_message(self, message: str):
         """Append a message to the status display."""
         if self.status_text:
             self.status_text.insert(tk.END, message)
             self.status_text.see(tk.END)
+            self._last_status = None
     
     def clear_messages(self):
         """Clear all messages from status display."""
         if self.status_text:
-            self.status_text.delete(1.0, tk.END)
\ No newline at end of file
+            self.status_text.delete(1.0, tk.END)
+            self._last_status = None
\ No newline at end of file
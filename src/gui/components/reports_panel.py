@@ -5,6 +5,7 @@ Implements Single Responsibility Principle - handles only reports UI.
 import tkinter as tk
 from typing import Callable, Optional
 from ..interfaces.component_interface import IComponent
+from .styles import LABEL_FRAME_STYLE, ACTION_BUTTON_STYLE
 
 
 class ReportsPanel(IComponent):
@@ -12,21 +13,20 @@ class ReportsPanel(IComponent):
     
     def __init__(self):
         self.frame = None
+        self.report_button = None
         
         # Callbacks
         self.on_generate_report: Optional[Callable] = None
     
     def create_widgets(self, parent: tk.Widget) -> tk.Widget:
         """Create and return the reports widgets."""
-        self.frame = tk.LabelFrame(parent, text="Reportes",
-                                  font=('Arial', 12, 'bold'),
-                                  bg='#000066', fg='white',
-                                  relief=tk.GROOVE, borderwidth=2)
+        self.frame = tk.LabelFrame(parent, text="Reportes", **LABEL_FRAME_STYLE)
         
-        tk.Button(self.frame, text="Generar Reporte Visual",
-                 command=self._handle_generate_report,
-                 bg='#FFFF44', fg='black', font=('Arial', 10, 'bold'),
-                 relief=tk.RAISED, borderwidth=2).pack(pady=10)
+        self.report_button = tk.Button(self.frame, text="Generar Reporte Visual",
+                                       command=self._handle_generate_report,
+                                       bg='#FFFF44', fg='black',
+                                       **ACTION_BUTTON_STYLE)
+        self.report_button.pack(pady=10)
         
         return self.frame
     
@@ -35,6 +35,11 @@ class ReportsPanel(IComponent):
         if self.on_generate_report:
             self.on_generate_report()
     
+    def set_busy(self, busy: bool):
+        """Disable the report button while a background job uses the route worker."""
+        if self.report_button:
+            self.report_button.config(state=tk.DISABLED if busy else tk.NORMAL)
+    
     def update_display(self):
         """Update the reports display."""
         # No display updates needed for this component
@@ -3,10 +3,58 @@ Route Planning Panel Component.
 Implements Single Responsibility Principle - handles only route planning UI.
 """
 import tkinter as tk
+from itertools import islice
 from tkinter import ttk, messagebox
-from typing import List, Callable, Optional
+from typing import Dict, List, Callable, Optional, Tuple
 from ...core import SpaceMap, Star
 from ..interfaces.component_interface import IComponent
+from .styles import PANEL_BG, LABEL_FRAME_STYLE
+
+
+# Máximo de opciones que recibe un combo al filtrar por el texto escrito
+STAR_FILTER_LIMIT = 200
+# Pausa al escribir antes de filtrar (una ráfaga de teclas = un solo filtrado)
+STAR_FILTER_DELAY_MS = 120
+
+# Estilos ttk del panel: nombre -> (fondo, texto, tamaño de fuente)
+BUTTON_STYLES = {
+    'Optimal': ('#4444FF', 'white', 10),
+    'MaxVisit': ('#44FFAA', 'black', 10),
+    'MinCost': ('#AA44FF', 'white', 10),
+    'Config': ('#CC6600', 'white', 9),
+    'Configured': ('#00AA00', 'white', 9),
+    'Validate': ('#FF6600', 'white', 9),
+    'Travel': ('#44FF44', 'black', 10),
+}
+
+
+def configure_panel_styles(master: tk.Widget):
+    """Define the panel's ttk styles once; widgets then only reference a style name."""
+    style = ttk.Style(master)
+    for name, (background, foreground, size) in BUTTON_STYLES.items():
+        style.configure(f'Galaxias.{name}.TButton', background=background, foreground=foreground,
+                        font=('Arial', size, 'bold'), relief=tk.RAISED, borderwidth=2)
+        style.map(f'Galaxias.{name}.TButton',
+                  background=[('disabled', '#555555'), ('active', background)],
+                  foreground=[('disabled', '#AAAAAA')])
+    style.configure('Galaxias.TLabel', background=PANEL_BG, foreground='white')
+    style.configure('Galaxias.Busy.TLabel', background=PANEL_BG, foreground='#FFDD44',
+                    font=('Arial', 9, 'italic'))
+
+
+class _StarCombobox(ttk.Combobox):
+    """Combobox that skips re-sending an unchanged option list to Tk."""
+    
+    def __init__(self, master: tk.Widget, **kwargs):
+        super().__init__(master, **kwargs)
+        # Opciones entregadas a Tk la última vez
+        self._shown_values: Tuple[str, ...] = ()
+    
+    def set_values(self, values: Tuple[str, ...]):
+        """Show these options; a no-op if they equal the current ones."""
+        if values != self._shown_values:
+            self.configure(values=values)
+            self._shown_values = values
 
 
 class RoutePlanningPanel(IComponent):
@@ -28,16 +76,31 @@ class RoutePlanningPanel(IComponent):
         self.on_edit_parameters: Optional[Callable] = None
         self.on_validate_impacts: Optional[Callable] = None
         self.on_travel: Optional[Callable] = None
+        # Avisa a otros paneles (reportes) cuando empieza o termina un trabajo
+        self.on_busy_change: Optional[Callable[[bool], None]] = None
         
         # State
         self.travel_enabled = False
+        self.busy = False
+        self.busy_message = ""
+        self.route_buttons: List[ttk.Button] = []
+        # Botones que leen o modifican el mapa (rutas, parámetros, impactos)
+        self.action_buttons: List[ttk.Button] = []
+        self.travel_button: Optional[ttk.Button] = None
+        # Último estado aplicado al botón de parámetros (None = sin aplicar)
+        self._config_button_state: Optional[bool] = None
+        self.busy_label = None
+        
+        # Opciones de los combos: se formatean al primer uso (una tupla compartida)
+        self._star_label_cache: Optional[Tuple[str, ...]] = None
+        self._id_by_display: Dict[str, str] = {}
+        # Filtrado pendiente de cada combo: combo -> id de after
+        self._filter_jobs: Dict[ttk.Combobox, str] = {}
     
     def create_widgets(self, parent: tk.Widget) -> tk.Widget:
         """Create and return the route planning widgets."""
-        self.frame = tk.LabelFrame(parent, text="Planificación de Ruta",
-                                  font=('Arial', 12, 'bold'),
-                                  bg='#000066', fg='white', 
-                                  relief=tk.GROOVE, borderwidth=2)
+        self.frame = tk.LabelFrame(parent, text="Planificación de Ruta", **LABEL_FRAME_STYLE)
+        configure_panel_styles(self.frame)
         
         self._create_star_selectors()
         self._create_route_buttons()
@@ -48,67 +111,128 @@ class RoutePlanningPanel(IComponent):
     
     def _create_star_selectors(self):
         """Create star selection widgets."""
-        # Start star selection
-        tk.Label(self.frame, text="Estrella Origen:", 
-                bg='#000066', fg='white').pack(anchor=tk.W, padx=5, pady=(5,0))
+        # La lista completa llega a los combos cuando se abre el desplegable o se escribe
+        labels = self.space_map.star_labels
         
-        star_names = [f"{s.label} ({s.id}) - E:{s.amount_of_energy}" 
-                     for s in self.space_map.get_all_stars_list()]
+        # Start star selection
+        ttk.Label(self.frame, text="Estrella Origen:",
+                  style='Galaxias.TLabel').pack(anchor=tk.W, padx=5, pady=(5,0))
         
-        self.start_combo = ttk.Combobox(self.frame, textvariable=self.start_star_var,
-                                       values=star_names, state='readonly', width=30)
-        self.start_combo.pack(padx=5, pady=5)
-        if star_names:
-            self.start_combo.current(0)
+        self.start_combo = self._create_star_combo(self.start_star_var)
+        if labels:
+            self.start_star_var.set(labels[0])
         
         # End star selection
-        tk.Label(self.frame, text="Estrella Destino:", 
-                bg='#000066', fg='white').pack(anchor=tk.W, padx=5)
+        ttk.Label(self.frame, text="Estrella Destino:",
+                  style='Galaxias.TLabel').pack(anchor=tk.W, padx=5)
+        
+        self.end_combo = self._create_star_combo(self.end_star_var)
+        if len(labels) > 1:
+            self.end_star_var.set(labels[1])
+    
+    def _create_star_combo(self, variable: tk.StringVar) -> _StarCombobox:
+        """Create a star combo whose options are filled on demand."""
+        combo = _StarCombobox(self.frame, textvariable=variable, width=30)
+        combo.configure(postcommand=lambda: self._populate_combo(combo))
+        combo.bind('<KeyRelease>', lambda event: self._schedule_filter(combo))
+        combo.pack(padx=5, pady=5)
+        return combo
+    
+    def _ensure_labels(self) -> Tuple[str, ...]:
+        """Take the map's combo texts (formatted once) and build the text -> star ID lookup."""
+        if self._star_label_cache is None:
+            self._star_label_cache = self.space_map.star_labels
+            self._id_by_display = dict(zip(self._star_label_cache,
+                                           self.space_map.get_all_star_ids()))
+        return self._star_label_cache
+    
+    def _matching_labels(self, text: str) -> Tuple[str, ...]:
+        """Options for the current combo text: all of them, or the first prefix matches."""
+        labels = self._ensure_labels()
+        prefix = text.strip().lower()
+        if not prefix or text in self._id_by_display:
+            return labels
+        matches = (label for label in labels if label.lower().startswith(prefix))
+        return tuple(islice(matches, STAR_FILTER_LIMIT))
+    
+    def _schedule_filter(self, combo: _StarCombobox):
+        """Debounce typing: filter once the keys stop for STAR_FILTER_DELAY_MS."""
+        self._cancel_filter(combo)
+        self._filter_jobs[combo] = self.frame.after(STAR_FILTER_DELAY_MS,
+                                                    lambda: self._populate_combo(combo))
+    
+    def _cancel_filter(self, combo: _StarCombobox):
+        """Cancel this combo's pending filter, if any (the other combo keeps its own)."""
+        job = self._filter_jobs.pop(combo, None)
+        if job is not None:
+            self.frame.after_cancel(job)
+    
+    def _populate_combo(self, combo: _StarCombobox):
+        """Fill the combo options right before they are shown (or after typing)."""
+        self._cancel_filter(combo)
+        combo.set_values(self._matching_labels(combo.get()))
+    
+    def get_star_id(self, display_text: str) -> Optional[str]:
+        """
+        Return the star ID for a combo text (O(1) lookup).
         
-        self.end_combo = ttk.Combobox(self.frame, textvariable=self.end_star_var,
-                                     values=star_names, state='readonly', width=30)
-        self.end_combo.pack(padx=5, pady=5)
-        if len(star_names) > 1:
-            self.end_combo.current(1)
+        The combos are editable, so a hand-edited or partial text such as
+        "Alpha (1)" falls back to the "(id)" it contains, as long as that
+        star exists.
+        """
+        self._ensure_labels()
+        star_id = self._id_by_display.get(display_text)
+        if star_id is not None:
+            return star_id
+        # Formato: "Label (id) - E:energy"
+        start = display_text.rfind('(')
+        end = display_text.find(')', start + 1)
+        if start != -1 and end != -1:
+            star_id = display_text[start + 1:end].strip()
+            if self.space_map.get_star(star_id):
+                return star_id
+        return None
     
     def _create_route_buttons(self):
         """Create route calculation buttons."""
-        tk.Button(self.frame, text="Calcular Ruta Óptima",
-                 command=self._handle_calculate_route,
-                 bg='#4444FF', fg='white', font=('Arial', 10, 'bold'),
-                 relief=tk.RAISED, borderwidth=2).pack(pady=5)
-
-        tk.Button(self.frame, text="Maximizar Estrellas Visitadas",
-                 command=self._handle_max_visit_route,
-                 bg='#44FFAA', fg='black', font=('Arial', 10, 'bold'),
-                 relief=tk.RAISED, borderwidth=2).pack(pady=5)
-
-        tk.Button(self.frame, text="Ruta Menor Gasto Posible",
-                 command=self._handle_min_cost_route,
-                 bg='#AA44FF', fg='white', font=('Arial', 10, 'bold'),
-                 relief=tk.RAISED, borderwidth=2).pack(pady=5)
+        self.route_buttons = [
+            ttk.Button(self.frame, text="Calcular Ruta Óptima",
+                       command=self._handle_calculate_route,
+                       style='Galaxias.Optimal.TButton'),
+            ttk.Button(self.frame, text="Maximizar Estrellas Visitadas",
+                       command=self._handle_max_visit_route,
+                       style='Galaxias.MaxVisit.TButton'),
+            ttk.Button(self.frame, text="Ruta Menor Gasto Posible",
+                       command=self._handle_min_cost_route,
+                       style='Galaxias.MinCost.TButton')
+        ]
+        for button in self.route_buttons:
+            button.pack(pady=5)
+        
+        # Indicador de cálculo en segundo plano
+        self.busy_label = ttk.Label(self.frame, text="", style='Galaxias.Busy.TLabel')
+        self.busy_label.pack()
     
     def _create_config_buttons(self):
         """Create configuration buttons."""
-        self.config_params_button = tk.Button(self.frame, text="⚙️ Configurar Parámetros",
-                 command=self._handle_edit_parameters,
-                 bg='#CC6600', fg='white', font=('Arial', 9, 'bold'),
-                 relief=tk.RAISED, borderwidth=2)
+        self.config_params_button = ttk.Button(self.frame, text="⚙️ Configurar Parámetros",
+                                               command=self._handle_edit_parameters,
+                                               style='Galaxias.Config.TButton')
         self.config_params_button.pack(pady=2)
         
-        tk.Button(self.frame, text="🔬 Validar Impactos de Investigación",
-                 command=self._handle_validate_impacts,
-                 bg='#FF6600', fg='white', font=('Arial', 9, 'bold'),
-                 relief=tk.RAISED, borderwidth=2).pack(pady=2)
+        self.validate_button = ttk.Button(self.frame, text="🔬 Validar Impactos de Investigación",
+                                          command=self._handle_validate_impacts,
+                                          style='Galaxias.Validate.TButton')
+        self.validate_button.pack(pady=2)
+        self.action_buttons = self.route_buttons + [self.config_params_button,
+                                                    self.validate_button]
     
     def _create_travel_button(self):
         """Create travel button."""
-        self.travel_button = tk.Button(self.frame, text="Iniciar Viaje",
-                                       command=self._handle_travel,
-                                       bg='#44FF44', fg='black', 
-                                       font=('Arial', 10, 'bold'),
-                                       relief=tk.RAISED, borderwidth=2,
-                                       state=tk.DISABLED)
+        self.travel_button = ttk.Button(self.frame, text="Iniciar Viaje",
+                                        command=self._handle_travel,
+                                        style='Galaxias.Travel.TButton',
+                                        state=tk.DISABLED)
         self.travel_button.pack(pady=5)
     
     def _handle_calculate_route(self):
@@ -144,9 +268,27 @@ class RoutePlanningPanel(IComponent):
     def update_display(self):
         """Update the component's display."""
         if self.travel_button:
-            state = tk.NORMAL if self.travel_enabled else tk.DISABLED
+            state = tk.NORMAL if self.travel_enabled and not self.busy else tk.DISABLED
             self.travel_button.config(state=state)
     
+    def set_busy(self, busy: bool, message: str = ""):
+        """
+        Disable every map action while a background job runs and show its progress.
+        
+        The worker thread reads the routes and research parameters, so nothing
+        that uses or changes them may run until it finishes.
+        """
+        self.busy = busy
+        self.busy_message = message if busy else ""
+        state = tk.DISABLED if busy else tk.NORMAL
+        for button in self.action_buttons:
+            button.config(state=state)
+        self.update_display()
+        if self.busy_label:
+            self.busy_label.config(text=self.busy_message)
+        if self.on_busy_change:
+            self.on_busy_change(busy)
+    
     def set_travel_enabled(self, enabled: bool):
         """Enable or disable travel button."""
         self.travel_enabled = enabled
@@ -154,15 +296,16 @@ class RoutePlanningPanel(IComponent):
     
     def update_config_button_status(self, has_custom_config: bool):
         """Update configuration button visual status."""
+        if has_custom_config == self._config_button_state:
+            return
+        self._config_button_state = has_custom_config
         if has_custom_config:
             self.config_params_button.config(
                 text="✅ Parámetros Configurados",
-                bg='#00AA00',
-                fg='white'
+                style='Galaxias.Configured.TButton'
             )
         else:
             self.config_params_button.config(
                 text="⚙️ Configurar Parámetros",
-                bg='#CC6600',
-                fg='white'
+                style='Galaxias.Config.TButton'
             )
\ No newline at end of file
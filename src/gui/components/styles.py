@@ -0,0 +1,29 @@
+"""
+Shared widget styles for the GUI components.
+Constantes inmutables a nivel de módulo: los paneles las expanden con ** en vez de
+repetir los mismos kwargs en cada widget.
+"""
+import tkinter as tk
+
+
+PANEL_BG = '#000066'
+
+# Tema ttk de la aplicación: respeta background/relief en los botones (los nativos
+# vista, xpnative y aqua los ignoran y el botón Configurado perdería su color)
+TTK_THEME = 'clam'
+
+# Marco de cada sección del panel izquierdo
+LABEL_FRAME_STYLE = {
+    'font': ('Arial', 12, 'bold'),
+    'bg': PANEL_BG,
+    'fg': 'white',
+    'relief': tk.GROOVE,
+    'borderwidth': 2,
+}
+
+# Botones de acción tk clásicos (el color de fondo/texto lo pone cada panel)
+ACTION_BUTTON_STYLE = {
+    'font': ('Arial', 10, 'bold'),
+    'relief': tk.RAISED,
+    'borderwidth': 2,
+}
@@ -4,13 +4,19 @@ Implements Single Responsibility Principle - handles only visualization display.
 """
 import tkinter as tk
 from tkinter import scrolledtext
-from typing import Optional, List, Dict, Any
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
+from typing import Optional, List, Dict, Any, TYPE_CHECKING
 from ...core import Star
 from ..interfaces.component_interface import IComponent
 
+if TYPE_CHECKING:
+    # Solo para anotaciones: matplotlib se carga al incrustar la primera figura
+    from matplotlib.figure import Figure
+
+
+# Tope del texto informativo: al superarlo se descartan las líneas más antiguas
+INFO_TEXT_MAX_LINES = 5000
+INFO_TEXT_TRIM_LINES = 2000
+
 
 class VisualizationPanel(IComponent):
     """Component responsible for visualization display."""
@@ -20,6 +26,8 @@ class VisualizationPanel(IComponent):
         self.canvas_frame = None
         self.info_text = None
         self.current_canvas = None
+        self._background = None
+        self._animated_artists = []
     
     def create_widgets(self, parent: tk.Widget) -> tk.Widget:
         """Create and return the visualization widgets."""
@@ -32,7 +40,8 @@ class VisualizationPanel(IComponent):
         # Info text at bottom
         self.info_text = scrolledtext.ScrolledText(self.frame, height=6, 
                                                    bg='#000033', fg='white',
-                                                   font=('Courier', 9))
+                                                   font=('Courier', 9),
+                                                   state=tk.DISABLED)
         self.info_text.pack(fill=tk.X, pady=5)
         
         return self.frame
@@ -43,32 +52,85 @@ class VisualizationPanel(IComponent):
         # are handled by update_visualization method
         pass
     
-    def update_visualization(self, fig: Figure):
+    def update_visualization(self, fig: 'Figure'):
         """Update the visualization with a new figure."""
+        # Misma figura: solo se redibujan los artistas animados sobre el fondo cacheado,
+        # salvo que la capa estática haya cambiado (figura stale)
+        if self.current_canvas is not None and self.current_canvas.figure is fig:
+            if fig.stale:
+                self.current_canvas.draw_idle()
+            else:
+                self._blit_animated()
+            return
+        
         # Clear previous canvas
         if self.current_canvas:
             self.current_canvas.get_tk_widget().destroy()
+        self._background = None
+        self._animated_artists = []
         
-        # Embed new figure in tkinter
+        # Embed new figure in tkinter (backend Tk de matplotlib cargado en el primer uso)
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
         self.current_canvas = FigureCanvasTkAgg(fig, master=self.canvas_frame)
-        self.current_canvas.draw()
+        # Cada dibujado completo (incluido un resize) recaptura el fondo estático
+        self.current_canvas.mpl_connect('draw_event', self._on_draw)
+        self.current_canvas.draw_idle()
         self.current_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
-        plt.close(fig)
+    
+    def _on_draw(self, event):
+        """Cache the static background and paint the animated artists on top."""
+        canvas = self.current_canvas
+        self._background = canvas.copy_from_bbox(canvas.figure.bbox)
+        # Los artistas animados solo cambian al reconstruir la capa estática,
+        # así que se localizan aquí y no en cada blit
+        self._animated_artists = [(ax, artist)
+                                  for ax in canvas.figure.axes
+                                  for artist in ax.get_children()
+                                  if artist.get_animated()]
+        self._draw_animated()
+    
+    def _draw_animated(self):
+        """Draw the figure's animated artists (skipped by a normal draw)."""
+        for ax, artist in self._animated_artists:
+            if artist.get_visible():
+                ax.draw_artist(artist)
+    
+    def _blit_animated(self):
+        """Restore the cached background, redraw animated artists and blit."""
+        canvas = self.current_canvas
+        if self._background is None:
+            canvas.draw_idle()
+            return
+        canvas.restore_region(self._background)
+        self._draw_animated()
+        canvas.blit(canvas.figure.bbox)
     
     def update_info_text(self, info: str):
         """Update the information text display."""
         if self.info_text:
-            self.info_text.delete(1.0, tk.END)
-            self.info_text.insert(1.0, info)
+            # Solo lectura para el usuario: se habilita durante la escritura
+            self.info_text.configure(state=tk.NORMAL)
+            self.info_text.replace('1.0', tk.END, info)
+            self.info_text.configure(state=tk.DISABLED)
     
     def append_info_text(self, text: str):
         """Append text to the information display."""
         if self.info_text:
+            self.info_text.configure(state=tk.NORMAL)
             self.info_text.insert(tk.END, text)
+            self._trim_info_text()
+            self.info_text.configure(state=tk.DISABLED)
             self.info_text.see(tk.END)
     
+    def _trim_info_text(self):
+        """Drop the oldest lines once the text grows past INFO_TEXT_MAX_LINES."""
+        line_count = int(self.info_text.index('end-1c').split('.')[0])
+        if line_count > INFO_TEXT_MAX_LINES:
+            self.info_text.delete('1.0', f'{INFO_TEXT_TRIM_LINES + 1}.0')
+    
     def clear_info_text(self):
         """Clear the information text display."""
         if self.info_text:
-            self.info_text.delete(1.0, tk.END)
\ No newline at end of file
+            self.info_text.configure(state=tk.NORMAL)
+            self.info_text.delete(1.0, tk.END)
+            self.info_text.configure(state=tk.DISABLED)
@@ -2,11 +2,11 @@
 Route Controller.
 Implements Single Responsibility Principle - handles only route-related logic.
 """
-from typing import List, Optional, Dict, Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, List, Optional, Dict, Any, Tuple
 from tkinter import messagebox
 from ...core import SpaceMap, Star, ResearchImpactValidator
-from ...core.research_impact_validator import ResearchImpactValidatorGUI
-from ...parameter_editor_simple.editor import ResearchParameterEditor
+from ...core.comet_impact_system import JOURNEY_OPTIMAL
 from ...parameter_editor_simple.models import ResearchParameters
 from ..interfaces.route_service_interface import IRouteService
 from ..interfaces.visualization_service_interface import IVisualizationService
@@ -29,6 +29,9 @@ class RouteController:
         # State
         self.current_path: Optional[List[Star]] = None
         self.current_path_stats: Optional[Dict[str, Any]] = None
+        # Texto de reglas de menor gasto, re-renderizado solo si cambian los parámetros
+        self._rules_info_cache: Optional[str] = None
+        self._rules_info_key: Optional[Tuple] = None
         
         # Callback for state changes
         self.on_state_change: Optional[callable] = None
@@ -52,6 +55,10 @@ class RouteController:
         self.research_impact_validator = ResearchImpactValidator(space_map)
         self.comet_impact_manager = None
         
+        # Los cálculos de rutas corren fuera del hilo de Tk (uno a la vez)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='route-solver')
+        self._poll_interval_ms = 100
+        
         # Setup callbacks
         self._setup_callbacks()
     
@@ -65,8 +72,8 @@ class RouteController:
     
     def calculate_optimal_route(self, start_text: str, end_text: str):
         """Calculate optimal route between selected stars."""
-        start_id = self.route_service.extract_star_id_from_text(start_text)
-        end_id = self.route_service.extract_star_id_from_text(end_text)
+        start_id = self.route_panel.get_star_id(start_text)
+        end_id = self.route_panel.get_star_id(end_text)
         
         if not start_id or not end_id:
             messagebox.showerror("Error", "Seleccione estrellas de origen y destino")
@@ -79,8 +86,16 @@ class RouteController:
             messagebox.showerror("Error", "Estrellas no encontradas")
             return
         
-        # Calculate path
-        path, stats = self.route_service.calculate_optimal_route(start_star, end_star)
+        # Calculate path (en segundo plano)
+        self.run_in_background(
+            "Calculando ruta óptima...",
+            lambda: self.route_service.calculate_optimal_route(start_star, end_star),
+            lambda result: self._on_optimal_route_done(start_star, end_star, result))
+    
+    def _on_optimal_route_done(self, start_star: Star, end_star: Star,
+                               result: Tuple[Optional[List[Star]], Optional[Dict[str, Any]]]):
+        """Show the optimal route once the background calculation finishes."""
+        path, stats = result
         
         if not path:
             error_msg = stats.get('error', 'Error desconocido') if stats else 'Error desconocido'
@@ -94,16 +109,12 @@ class RouteController:
         self.current_path_stats = stats
         
         # Register for comet impact analysis
-        self._register_active_journey(path, "optimal")
+        self._register_active_journey(path, JOURNEY_OPTIMAL)
         
         # Update displays
         self._update_info_display(start_star, end_star, stats)
-        self._update_route_visualization(path)
         self.route_panel.set_travel_enabled(True)
-        
-        # Notify state change for GUI updates
-        if self.on_state_change:
-            self.on_state_change()
+        self._refresh_after_route(path)
         
         messagebox.showinfo("Ruta Calculada", 
                            f"Ruta encontrada con {stats.get('num_jumps', 0)} saltos")
@@ -111,7 +122,7 @@ class RouteController:
     
     def calculate_max_visit_route(self, start_text: str):
         """Calculate route that maximizes star visits."""
-        start_id = self.route_service.extract_star_id_from_text(start_text)
+        start_id = self.route_panel.get_star_id(start_text)
         
         if not start_id:
             messagebox.showerror("Error", "Selecciona una estrella de inicio")
@@ -122,7 +133,18 @@ class RouteController:
             messagebox.showerror("Error", "Estrella de inicio no encontrada")
             return
         
-        path, stats = self.route_service.calculate_max_visit_route(start_star)
+        def solve():
+            path, stats = self.route_service.calculate_max_visit_route(start_star)
+            path_stats = self.route_service.calculate_path_stats(path) if path else None
+            return path, stats, path_stats
+        
+        self.run_in_background("Calculando ruta de máximo alcance...", solve,
+                                self._on_max_visit_route_done)
+    
+    def _on_max_visit_route_done(self, result: Tuple[Optional[List[Star]], Optional[Dict[str, Any]],
+                                                     Optional[Dict[str, Any]]]):
+        """Show the max-visit route once the background calculation finishes."""
+        path, stats, path_stats = result
         
         if not path:
             error_msg = stats.get('error', 'No se pudo encontrar ruta válida') if stats else 'Error desconocido'
@@ -131,16 +153,12 @@ class RouteController:
         
         # Update current path
         self.current_path = path
-        self.current_path_stats = self.route_service.calculate_path_stats(path)
+        self.current_path_stats = path_stats
         
         # Update info display
         self._update_max_visit_info(stats)
-        self._update_route_visualization(path)
         self.route_panel.set_travel_enabled(True)
-        
-        # Notify state change for GUI updates
-        if self.on_state_change:
-            self.on_state_change()
+        self._refresh_after_route(path)
         
         json_values = stats.get('json_values_used', {})
         messagebox.showinfo("Ruta de Máximo Alcance (JSON)", 
@@ -152,7 +170,7 @@ class RouteController:
     
     def calculate_min_cost_route(self, start_text: str):
         """Calculate minimum cost route."""
-        start_id = self.route_service.extract_star_id_from_text(start_text)
+        start_id = self.route_panel.get_star_id(start_text)
         
         if not start_id:
             messagebox.showwarning("Advertencia", "Por favor selecciona una estrella de origen")
@@ -167,7 +185,15 @@ class RouteController:
         if not self._confirm_min_cost_rules():
             return
         
-        path, stats = self.route_service.calculate_min_cost_route(start_star, self.research_parameters)
+        research_parameters = self.research_parameters
+        self.run_in_background(
+            "Calculando ruta de menor gasto...",
+            lambda: self.route_service.calculate_min_cost_route(start_star, research_parameters),
+            self._on_min_cost_route_done)
+    
+    def _on_min_cost_route_done(self, result: Tuple[Optional[List[Star]], Optional[Dict[str, Any]]]):
+        """Show the min-cost route once the background calculation finishes."""
+        path, stats = result
         
         if not path:
             error_msg = stats.get('error', 'No se pudo calcular la ruta') if stats else 'Error desconocido'
@@ -180,12 +206,8 @@ class RouteController:
         
         # Update info display
         self._update_min_cost_info(stats)
-        self._update_route_visualization(path)
         self.route_panel.set_travel_enabled(True)
-        
-        # Notify state change for GUI updates
-        if self.on_state_change:
-            self.on_state_change()
+        self._refresh_after_route(path)
         
         messagebox.showinfo("Éxito", 
             f"Ruta de menor gasto calculada!\n"
@@ -193,11 +215,54 @@ class RouteController:
             f"Pasto consumido: {stats.get('total_grass_consumed', 0):.2f} kg\n"
             f"Energía final: {stats.get('final_energy', 0):.2f}%")
     
+    def run_in_background(self, message: str, job: Callable[[], Any],
+                          on_done: Callable[[Any], None],
+                          on_error: Optional[Callable[[Exception], None]] = None) -> bool:
+        """
+        Run a job in the worker thread and hand its result to on_done on the Tk thread.
+        
+        Completion is detected by polling with after(), so no Tk call is ever
+        made from the worker thread. Errors go to on_error (default: a message box).
+        
+        Returns False (after telling the user) if another job is still running.
+        """
+        if self.route_panel.busy:
+            messagebox.showwarning("Operación en curso",
+                                   f"Espere a que termine la operación actual: "
+                                   f"{self.route_panel.busy_message}")
+            return False
+        self.route_panel.set_busy(True, message)
+        future = self._executor.submit(job)
+        root = self.route_panel.frame.winfo_toplevel()
+        root.after(self._poll_interval_ms, self._poll_job, root, future, on_done, on_error)
+        return True
+    
+    def shutdown(self):
+        """Stop the worker thread without waiting (pending jobs are cancelled)."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _poll_job(self, root, future: Future, on_done: Callable[[Any], None],
+                  on_error: Optional[Callable[[Exception], None]] = None):
+        """Check the background job; reschedule until it finishes."""
+        if not future.done():
+            root.after(self._poll_interval_ms, self._poll_job, root, future, on_done, on_error)
+            return
+        self.route_panel.set_busy(False)
+        try:
+            result = future.result()
+        except Exception as e:
+            if on_error:
+                on_error(e)
+            else:
+                messagebox.showerror("Error", f"Error calculando la ruta: {str(e)}")
+            return
+        on_done(result)
+    
     def edit_research_parameters(self):
         """Open research parameters editor."""
         try:
-            # Create parameter editor window
-            import tkinter as tk
+            # El editor se importa al abrirlo (no hace falta al arrancar la GUI)
+            from ...parameter_editor_simple.editor import ResearchParameterEditor
             
             # Get the root window for the editor
             root = self.route_panel.frame.winfo_toplevel()
@@ -218,7 +283,7 @@ class RouteController:
             
             if result:
                 self.research_parameters = result
-                self._update_config_button_status()
+                self.update_config_button_status()
                 messagebox.showinfo("Éxito", "Parámetros de investigación actualizados correctamente")
             
         except Exception as e:
@@ -231,6 +296,7 @@ class RouteController:
             root = self.route_panel.frame.winfo_toplevel()
             
             # Create validator GUI - it opens automatically in __init__
+            from ...core.research_impact_validator import ResearchImpactValidatorGUI
             validator_gui = ResearchImpactValidatorGUI(root, self.space_map)
             
             # Note: No need to call show() as the window is created and shown in __init__
@@ -257,9 +323,18 @@ class RouteController:
         if self.comet_impact_manager and path and len(path) > 1:
             self.comet_impact_manager.register_active_journey(path, 0, journey_type)
     
+    @staticmethod
+    def _format_path(names: List[str]) -> str:
+        """Join star names in travel order."""
+        return ' → '.join(names)
+    
     def _update_info_display(self, start_star: Star, end_star: Star, stats: Dict[str, Any]):
         """Update the information display for optimal route."""
-        info = f"""
+        self.visualization_panel.update_info_text(self._render_optimal_report(start_star, end_star, stats))
+    
+    def _render_optimal_report(self, start_star: Star, end_star: Star, stats: Dict[str, Any]) -> str:
+        """Render the optimal route report."""
+        return f"""
 RUTA CALCULADA
 {'='*60}
 Origen: {start_star.label}
@@ -277,13 +352,16 @@ Recursos Necesarios:
 - Energía Ganada: {stats.get('total_energy_gained', 0):.2f}
 - Balance Neto: {stats.get('net_energy', 0):.2f}
 
-Ruta: {' → '.join(stats.get('path_stars', []))}
+Ruta: {self._format_path(stats.get('path_stars', []))}
         """
-        self.visualization_panel.update_info_text(info)
     
     def _update_eating_route_info(self, stats: Dict[str, Any]):
         """Update info display for eating route."""
-        info = f"""
+        self.visualization_panel.update_info_text(self._render_eating_report(stats))
+    
+    def _render_eating_report(self, stats: Dict[str, Any]) -> str:
+        """Render the eating route report."""
+        return f"""
 RUTA OPTIMIZADA PARA COMER ESTRELLAS
 {'='*60}
 Estrellas Visitadas: {stats.get('stars_visited', 0)}
@@ -298,15 +376,18 @@ Condiciones Iniciales:
 - Edad: {stats.get('initial_condition', {}).get('edad', 'N/A')} años
 
 Ruta Optimizada:
-{' → '.join(stats.get('route', []))}
+{self._format_path(stats.get('route', []))}
         """
-        self.visualization_panel.update_info_text(info)
     
     def _update_max_visit_info(self, stats: Dict[str, Any]):
         """Update info display for max visit route."""
+        self.visualization_panel.update_info_text(self._render_max_visit_report(stats))
+    
+    def _render_max_visit_report(self, stats: Dict[str, Any]) -> str:
+        """Render the max visit route report."""
         json_values = stats.get('json_values_used', {})
         
-        info = f"""
+        return f"""
 RUTA DE MÁXIMAS ESTRELLAS (SOLO VALORES DEL JSON)
 {'='*60}
 Estrellas Visitadas: {stats.get('stars_visited', 0)}
@@ -323,18 +404,21 @@ VALORES USADOS DEL JSON (INMUTABLES):
 - Age Factor: {json_values.get('age_factor', 'N/A'):.2f}
 
 Secuencia de Estrellas:
-{' → '.join(stats.get('path_stars', []))}
+{self._format_path(stats.get('path_stars', []))}
 
 IMPORTANTE: Esta ruta usa EXCLUSIVAMENTE los valores 
 iniciales del archivo constellations.json.
 
 {stats.get('notes', '')}
         """
-        self.visualization_panel.update_info_text(info)
     
     def _update_min_cost_info(self, stats: Dict[str, Any]):
         """Update info display for min cost route."""
-        info = f"""
+        self.visualization_panel.update_info_text(self._render_min_cost_report(stats))
+    
+    def _render_min_cost_report(self, stats: Dict[str, Any]) -> str:
+        """Render the min cost route report."""
+        return f"""
 RUTA DE MENOR GASTO POSIBLE
 {'='*60}
 Estrellas Visitadas: {stats.get('stars_visited', 0)}
@@ -361,16 +445,29 @@ Configuraciones Especiales:
 - Estrellas con Config. Personalizada: {len(self.research_parameters.custom_star_settings)}
 
 Ruta Optimizada:
-{' → '.join(stats.get('path_stars', []))}
+{self._format_path(stats.get('path_stars', []))}
 
 NOTA: Esta ruta minimiza el gasto total de recursos
 siguiendo las reglas de investigación configuradas.
         """
-        self.visualization_panel.update_info_text(info)
     
     def _confirm_min_cost_rules(self) -> bool:
         """Show min cost rules confirmation dialog."""
-        rules_info = f"""
+        return messagebox.askyesno("Confirmar Reglas", self._get_rules_info())
+    
+    def _get_rules_info(self) -> str:
+        """Rules text for the current research parameters (cached per parameter values)."""
+        params = self.research_parameters
+        key = (params.time_percentage, params.energy_consumption_rate,
+               len(params.custom_star_settings))
+        if key != self._rules_info_key:
+            self._rules_info_cache = self._render_rules_info()
+            self._rules_info_key = key
+        return self._rules_info_cache
+    
+    def _render_rules_info(self) -> str:
+        """Render the min cost rules text."""
+        return f"""
 REGLAS DE MENOR GASTO POSIBLE:
 
 • Solo puede comer si energía < 50%
@@ -387,10 +484,8 @@ REGLAS DE MENOR GASTO POSIBLE:
 • Objetivo: MENOR GASTO total
 
 ¿Continuar con el cálculo?"""
-        
-        return messagebox.askyesno("Confirmar Reglas", rules_info)
     
-    def _update_config_button_status(self):
+    def update_config_button_status(self):
         """Update configuration button visual status."""
         has_custom_config = (
             self.research_parameters.energy_consumption_rate != 2.0 or
@@ -402,6 +497,17 @@ REGLAS DE MENOR GASTO POSIBLE:
         
         self.route_panel.update_config_button_status(has_custom_config)
     
+    def _refresh_after_route(self, path: List[Star]):
+        """
+        Notify the new route; the GUI's coalesced refresh redraws the map once.
+        
+        Without a state-change listener the map is updated directly.
+        """
+        if self.on_state_change:
+            self.on_state_change()
+        else:
+            self._update_route_visualization(path)
+    
     def _update_route_visualization(self, path: List[Star]):
         """Update the route visualization."""
         try:
@@ -420,7 +526,14 @@ REGLAS DE MENOR GASTO POSIBLE:
             print(f"Error updating visualization: {e}")  # Debug info
     
     def _update_visualization_callback(self):
-        """Callback for updating visualization when comets change."""
+        """
+        Callback for updating visualization when comets change.
+        
+        With a state-change listener the redraw is coalesced with the GUI refresh.
+        """
+        if self.on_state_change:
+            self.on_state_change()
+            return
         try:
             # Update visualization without a specific path to show all changes
             burro = self.space_map.create_burro_astronauta()
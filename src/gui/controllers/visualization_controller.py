@@ -2,11 +2,17 @@
 Visualization Controller.
 Implements Single Responsibility Principle - handles only visualization operations.
 """
+import base64
+import io
+import tkinter as tk
 from typing import Optional, List, Dict, Any
 from ...core import BurroAstronauta, Star
 from ..interfaces.visualization_service_interface import IVisualizationService
 from ..components.visualization_panel import VisualizationPanel
 
+# Resolución del reporte mostrado en pantalla (el PNG guardado usa 150 dpi)
+REPORT_DISPLAY_DPI = 100
+
 
 class VisualizationController:
     """Controller for visualization operations."""
@@ -18,8 +24,10 @@ class VisualizationController:
         self.burro = burro
     
     def update_visualization(self, path: Optional[List[Star]] = None):
-        """Update the space map visualization."""
+        """Update the space map visualization (no-op if nothing visible changed)."""
         try:
+            if self.visualization_service.is_current(path, self.burro.current_location):
+                return
             fig = self.visualization_service.update_visualization(
                 path=path, 
                 burro_location=self.burro.current_location
@@ -31,18 +39,44 @@ class VisualizationController:
     def generate_report(self, path_stats: Optional[Dict[str, Any]] = None):
         """Generate visual journey report."""
         try:
-            if not path_stats:
-                # Use empty stats if none provided
-                from ...algorithms import RouteCalculator
-                from ...core import SpaceMap
-                space_map = SpaceMap('data/constellations.json')
-                config = {}
-                calculator = RouteCalculator(space_map, config)
-                path_stats = calculator.calculate_path_stats([])
-            
-            self.visualization_service.generate_journey_report(self.burro, path_stats)
+            self.show_report(self.render_report(path_stats))
         except Exception as e:
-            self.visualization_panel.append_info_text(f"\nError generando reporte: {str(e)}")
+            self.report_error(e)
+    
+    def render_report(self, path_stats: Optional[Dict[str, Any]] = None) -> bytes:
+        """
+        Render and save the report, returning it as PNG bytes for display.
+        
+        No Tk calls: may run in a worker thread. The window then only decodes
+        the PNG, so the figure is never rendered again on the Tk thread.
+        """
+        if not path_stats:
+            # Use empty stats if none provided
+            from ...algorithms import RouteCalculator
+            from ...core import SpaceMap
+            space_map = SpaceMap('data/constellations.json')
+            config = {}
+            calculator = RouteCalculator(space_map, config)
+            path_stats = calculator.calculate_path_stats([])
+        
+        fig = self.visualization_service.generate_journey_report(self.burro, path_stats)
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format='png', dpi=REPORT_DISPLAY_DPI, facecolor=fig.get_facecolor())
+        return buffer.getvalue()
+    
+    def show_report(self, png_data: bytes):
+        """Show a rendered report image in its own window (Tk thread)."""
+        window = tk.Toplevel(self.visualization_panel.frame.winfo_toplevel())
+        window.title("Galaxias - Reporte de Viaje")
+        window.configure(bg='#000033')
+        image = tk.PhotoImage(master=window, data=base64.b64encode(png_data))
+        label = tk.Label(window, image=image, bg='#000033')
+        label.image = image  # Mantener la referencia mientras viva la ventana
+        label.pack(fill=tk.BOTH, expand=True)
+    
+    def report_error(self, error: Exception):
+        """Show a report generation error in the info text."""
+        self.visualization_panel.append_info_text(f"\nError generando reporte: {str(error)}")
     
     def update_info_text(self, text: str):
         """Update the information text."""
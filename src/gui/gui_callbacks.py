@@ -1,3 +1,4 @@
 def setup_additional_callbacks(route_panel, reports_panel, route_controller, _start_journey, _generate_report):
     route_panel.on_travel = _start_journey
     reports_panel.on_generate_report = _generate_report
+    route_panel.on_busy_change = reports_panel.set_busy
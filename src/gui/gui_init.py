@@ -21,8 +21,12 @@ def initialize_services(research_params=None):
 
 def initialize_models(space_map):
     burro = space_map.create_burro_astronauta()
+    return burro
+
+def initialize_deferred_systems(space_map):
+    """Subsistemas que no hacen falta para pintar la primera ventana."""
     hypergiant_system = HyperGiantJumpSystem(space_map)
-    return burro, hypergiant_system
+    return hypergiant_system
 
 def initialize_components(space_map, burro):
     route_panel = RoutePlanningPanel(space_map)
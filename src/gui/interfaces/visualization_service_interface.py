@@ -17,7 +17,12 @@ class IVisualizationService(ABC):
         """Update the space map visualization."""
         pass
     
+    def is_current(self, path: Optional[List[Star]] = None,
+                   burro_location: Optional[Star] = None) -> bool:
+        """Whether the last visualization already shows this state (redraw can be skipped)."""
+        return False
+    
     @abstractmethod
-    def generate_journey_report(self, burro: BurroAstronauta, stats: dict) -> None:
-        """Generate visual journey report."""
+    def generate_journey_report(self, burro: BurroAstronauta, stats: dict) -> matplotlib.figure.Figure:
+        """Generate visual journey report (no Tk calls: may run in a worker thread)."""
         pass
\ No newline at end of file
@@ -10,14 +10,25 @@ Key improvements:
 5. Dependency Inversion Principle: Depends on abstractions, not concretions
 """
 
+import time
 import tkinter as tk
+from tkinter import ttk
+import matplotlib
 from typing import List, Optional
 from ..core import Star
 from .gui_init import (
-    initialize_services, initialize_models, initialize_components, initialize_controllers
+    initialize_services, initialize_models, initialize_components, initialize_controllers,
+    initialize_deferred_systems
 )
 from .gui_callbacks import setup_additional_callbacks
 from .services.burro_journey_service import BurroJourneyService
+from .components.styles import TTK_THEME
+
+# Intervalo mínimo entre refrescos de la GUI (~30 por segundo como máximo)
+MIN_DISPLAY_UPDATE_INTERVAL_MS = 33
+
+# Backend fijo para la app Tk: evita que matplotlib autodetecte otro (MacOSX, Qt...)
+MATPLOTLIB_BACKEND = 'TkAgg'
 
 
 class GalaxiasGUI:
@@ -51,20 +62,33 @@ class GalaxiasGUI:
         # --- FIN ---
         (self.config_service, self.config, self.space_map, self.route_service,
          self.visualization_service, self.journey_service) = initialize_services(self.research_params)
-        self.burro, self.hypergiant_system = initialize_models(self.space_map)
+        self.burro = initialize_models(self.space_map)
+        self.hypergiant_system = None  # Se crea en _deferred_init
+        self._display_update_pending = False
+        self._last_display_update = 0.0  # time.monotonic() del último refresco
         (self.route_panel, self.burro_panel, self.reports_panel, self.visualization_panel) = initialize_components(self.space_map, self.burro)
         (self.route_controller, self.burro_controller, self.visualization_controller) = initialize_controllers(
             self.route_service, self.space_map, self.route_panel, self.visualization_panel,
             self.visualization_service, self.burro, self.burro_panel)
-        self.route_controller.on_state_change = self._update_all_displays
-        self.burro_controller.on_state_change = self._update_all_displays
+        self.route_controller.on_state_change = self.request_display_update
+        self.burro_controller.on_state_change = self.request_display_update
         setup_additional_callbacks(
             self.route_panel, self.reports_panel,
             self.route_controller,
             self._start_journey, self._generate_report
         )
         self._setup_layout()
+        # Lo costoso (mapa inicial, subsistemas) se hace después del primer pintado
+        self.route_panel.set_busy(True, "Cargando mapa...")
+        self.root.after_idle(self._deferred_init)
+    
+    def _deferred_init(self):
+        """Initialize heavy subsystems and the first visualization once the window is shown."""
+        self.root.update_idletasks()
+        self.hypergiant_system = initialize_deferred_systems(self.space_map)
         self._initial_updates()
+        self.route_controller.update_config_button_status()
+        self.route_panel.set_busy(False)
 
     def open_research_parameter_editor(self):
         """Abre el editor de parámetros de investigación y actualiza el sistema si se confirman cambios."""
@@ -81,13 +105,21 @@ class GalaxiasGUI:
             # Reinicializar journey_service con los nuevos parámetros
             self.journey_service = BurroJourneyService(self.space_map, research_params=self.research_params)
             # Refrescar GUI y rutas
-            self._update_all_displays()
+            self.request_display_update()
     
     def _setup_window(self):
         """Configure the main window."""
         self.root.title("Galaxias - Sistema de Rutas del Burro Astronauta")
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         self.root.geometry("1400x900")
         self.root.configure(bg='#000033')
+        # Un solo tema para toda la app (paneles, editor de parámetros, cometas)
+        ttk.Style(self.root).theme_use(TTK_THEME)
+    
+    def _on_close(self):
+        """Stop the route worker and close the window."""
+        self.route_controller.shutdown()
+        self.root.destroy()
     
     
     def _setup_layout(self):
@@ -118,11 +150,31 @@ class GalaxiasGUI:
         self.visualization_panel.create_widgets(right_panel).pack(fill=tk.BOTH, expand=True)
     
     def _initial_updates(self):
-        """Perform initial updates to all components."""
+        """Perform initial updates to all components (includes the first map render)."""
         self._update_all_displays()
+    
+    def request_display_update(self):
+        """
+        Schedule _update_all_displays for the next idle moment.
         
-        # Initial visualization
-        self.visualization_controller.update_visualization()
+        Several state changes in the same event-loop turn collapse into one refresh,
+        and refreshes are spaced at least MIN_DISPLAY_UPDATE_INTERVAL_MS apart.
+        """
+        if self._display_update_pending:
+            return
+        self._display_update_pending = True
+        elapsed_ms = (time.monotonic() - self._last_display_update) * 1000
+        if elapsed_ms >= MIN_DISPLAY_UPDATE_INTERVAL_MS:
+            self.root.after_idle(self._run_display_update)
+        else:
+            self.root.after(int(MIN_DISPLAY_UPDATE_INTERVAL_MS - elapsed_ms) + 1,
+                            self._run_display_update)
+    
+    def _run_display_update(self):
+        """Run the coalesced display refresh."""
+        self._display_update_pending = False
+        self._last_display_update = time.monotonic()
+        self._update_all_displays()
     
     def _update_all_displays(self):
         """Update all component displays."""
@@ -131,9 +183,8 @@ class GalaxiasGUI:
             self.burro_controller.update_display()
             # Update visualization with current burro position AND current path
             current_path = self.route_controller.get_current_path()
+            # Sin flush forzado: el canvas pinta con draw_idle en el siguiente ciclo ocioso
             self.visualization_controller.update_visualization(path=current_path)
-            # Force UI refresh
-            self.root.update_idletasks()
         except Exception as e:
             print(f"Warning: Error updating displays: {e}")  # Debug info
     
@@ -150,7 +201,12 @@ class GalaxiasGUI:
         self._simulate_journey(current_path)
     
     def _simulate_journey(self, path: List[Star]):
-        """Simulate the journey along the given path using unified burro logic."""
+        """
+        Simulate the journey along the given path using unified burro logic.
+        
+        The simulation runs in the route worker thread; its steps are then
+        played back with after() so the window stays responsive.
+        """
         from tkinter import messagebox
         
         if not path:
@@ -158,91 +214,138 @@ class GalaxiasGUI:
             return
       
         # Simular el viaje completo con la lógica unificada
+        started = self.route_controller.run_in_background(
+            "Simulando viaje...",
+            lambda: self.journey_service.simulate_journey(path, self.burro),
+            self._play_journey,
+            on_error=self._on_journey_error)
+        if not started:
+            return
+        
+        # El resultado llega por after(), así que este mensaje siempre va primero
         start_msg = f"\n🚀 INICIANDO VIAJE - Ruta de {len(path)} estrellas"
         self.burro_controller.append_status_message(start_msg)
-        self._update_all_displays()
-        self.root.update()
+        self.request_display_update()
+    
+    def _play_journey(self, journey_steps):
+        """Start playing back the simulated steps (Tk thread)."""
+        from tkinter import messagebox
+        
+        if not journey_steps:
+            messagebox.showerror("Error", "No se pudo procesar el viaje")
+            return
         
+        # Mientras se reproduce el viaje no se calculan rutas ni se inicia otro viaje
+        self.route_panel.set_busy(True, "Viaje en curso...")
+        self.route_panel.set_travel_enabled(False)
+        self._show_journey_step(journey_steps, 0)
+    
+    def _end_journey_playback(self):
+        """Re-enable route planning after the journey playback."""
+        self.route_panel.set_busy(False)
+        self.route_panel.set_travel_enabled(True)
+    
+    def _show_journey_step(self, journey_steps, i: int):
+        """Show step i, apply it to the burro and schedule the next one."""
+        step = journey_steps[i]
         try:
-            # Procesar viaje paso a paso
-            journey_steps = self.journey_service.simulate_journey(path, self.burro)
+            self._display_journey_step(step, i)
             
-            if not journey_steps:
-                messagebox.showerror("Error", "No se pudo procesar el viaje")
-                return
+            # Aplicar cambios al burro paso a paso
+            self.burro.current_energy = step.energy_after_star
+            self.burro.current_pasto = step.grass_after_star
+            self.burro.estado_salud = step.health_after_star
+            self.burro.current_age = (self.journey_service.start_age + 
+                                     (self.journey_service.initial_life_remaining - step.life_remaining_after_star))
+            self.burro.total_life_consumed = (self.journey_service.initial_life_remaining - 
+                                             step.life_remaining_after_star)
+            self.burro.current_location = step.star
+            if step.star not in self.burro.journey_history:
+                self.burro.journey_history.append(step.star)
             
-            # Mostrar cada paso del viaje
-            for i, step in enumerate(journey_steps):
-                self._display_journey_step(step, i)
-                
-                # Aplicar cambios al burro paso a paso
-                self.burro.current_energy = step.energy_after_star
-                self.burro.current_pasto = step.grass_after_star
-                self.burro.estado_salud = step.health_after_star
-                self.burro.current_age = (self.journey_service.start_age + 
-                                         (self.journey_service.initial_life_remaining - step.life_remaining_after_star))
-                self.burro.total_life_consumed = (self.journey_service.initial_life_remaining - 
-                                                 step.life_remaining_after_star)
-                self.burro.current_location = step.star
-                if step.star not in self.burro.journey_history:
-                    self.burro.journey_history.append(step.star)
-                
-                # Actualizar GUI
-                self._update_all_displays()
-                self.root.update()
-                
-                # Pausa para visualización
-                import time
-                time.sleep(0.8)  # Pausa más larga para ver los cambios
-                
-                # Verificar si murió
-                if step.health_after_star == "muerto":
-                    death_msg = f"\n💀 EL BURRO ASTRONAUTA HA MUERTO EN {step.star.label}"
-                    self.burro_controller.append_status_message(death_msg)
-                    self._update_all_displays()
-                    messagebox.showerror("Viaje Fallido", 
-                                        f"El Burro Astronauta murió en {step.star.label}\n"
-                                        f"Visitó {len(journey_steps)} estrellas antes de morir")
-                    return
-            
-            # Aplicar estado final al burro
-            self.journey_service.apply_journey_to_burro(self.burro, journey_steps)
-            
-            # Generar resumen del viaje
-            summary = self.journey_service.get_journey_summary(journey_steps)
-            
-            # Mostrar resumen final
-            final_msg = (f"\n🎉 VIAJE COMPLETADO EXITOSAMENTE!"
-                        f"\n📊 Estrellas visitadas: {summary['stars_visited']}"
-                        f"\n⚡ Energía: {summary['initial_energy']}% → {summary['final_energy']:.1f}%"
-                        f"\n🌾 Pasto: {summary['initial_grass']} kg → {summary['final_grass']:.1f} kg"
-                        f"\n💚 Salud: {summary['initial_health'].upper()} → {summary['final_health'].upper()}"
-                        f"\n⏰ Vida: {summary['initial_life']:.1f} → {summary['final_life']:.1f} años"
-                        f"\n🍽️ Pasto consumido: {summary['total_grass_consumed']:.1f} kg"
-                        f"\n�️ Vida consumida: {summary['total_life_consumed']:.1f} años")
-            
-            self.burro_controller.append_status_message(final_msg)
-            self._update_all_displays()
-            
-            messagebox.showinfo("Viaje Completado", 
-                               f"¡Viaje exitoso!\n"
-                               f"Estrellas visitadas: {summary['stars_visited']}\n"
-                               f"Energía final: {summary['final_energy']:.1f}%\n"
-                               f"Pasto restante: {summary['final_grass']:.1f} kg\n"
-                               f"Estado final: {summary['final_health'].upper()}")
+            # Actualizar GUI
+            self.request_display_update()
+        except Exception as e:
+            self._end_journey_playback()
+            self._on_journey_error(e)
+            return
+        
+        # Pausa para visualización (sin bloquear el bucle de eventos)
+        self.root.after(800, self._after_journey_step, journey_steps, i)
+    
+    def _after_journey_step(self, journey_steps, i: int):
+        """Check for death, then continue with the next step or finish."""
+        from tkinter import messagebox
+        
+        step = journey_steps[i]
+        # Verificar si murió
+        if step.health_after_star == "muerto":
+            self._end_journey_playback()
+            death_msg = f"\n💀 EL BURRO ASTRONAUTA HA MUERTO EN {step.star.label}"
+            self.burro_controller.append_status_message(death_msg)
+            self.request_display_update()
+            messagebox.showerror("Viaje Fallido", 
+                                f"El Burro Astronauta murió en {step.star.label}\n"
+                                f"Visitó {len(journey_steps)} estrellas antes de morir")
+            return
         
+        if i + 1 < len(journey_steps):
+            self._show_journey_step(journey_steps, i + 1)
+            return
+        
+        self._end_journey_playback()
+        try:
+            self._finish_journey(journey_steps)
         except Exception as e:
-            error_msg = f"\n❌ ERROR DURANTE EL VIAJE: {str(e)}"
-            self.burro_controller.append_status_message(error_msg)
-            self._update_all_displays()
-            messagebox.showerror("Error", f"Error durante la simulación: {str(e)}")
+            self._on_journey_error(e)
+    
+    def _finish_journey(self, journey_steps):
+        """Apply the final state and show the journey summary."""
+        from tkinter import messagebox
+        
+        # Aplicar estado final al burro
+        self.journey_service.apply_journey_to_burro(self.burro, journey_steps)
+        
+        # Generar resumen del viaje
+        summary = self.journey_service.get_journey_summary(journey_steps)
+        
+        # Mostrar resumen final
+        final_msg = (f"\n🎉 VIAJE COMPLETADO EXITOSAMENTE!"
+                    f"\n📊 Estrellas visitadas: {summary['stars_visited']}"
+                    f"\n⚡ Energía: {summary['initial_energy']}% → {summary['final_energy']:.1f}%"
+                    f"\n🌾 Pasto: {summary['initial_grass']} kg → {summary['final_grass']:.1f} kg"
+                    f"\n💚 Salud: {summary['initial_health'].upper()} → {summary['final_health'].upper()}"
+                    f"\n⏰ Vida: {summary['initial_life']:.1f} → {summary['final_life']:.1f} años"
+                    f"\n🍽️ Pasto consumido: {summary['total_grass_consumed']:.1f} kg"
+                    f"\n�️ Vida consumida: {summary['total_life_consumed']:.1f} años")
+        
+        self.burro_controller.append_status_message(final_msg)
+        self.request_display_update()
+        
+        messagebox.showinfo("Viaje Completado", 
+                           f"¡Viaje exitoso!\n"
+                           f"Estrellas visitadas: {summary['stars_visited']}\n"
+                           f"Energía final: {summary['final_energy']:.1f}%\n"
+                           f"Pasto restante: {summary['final_grass']:.1f} kg\n"
+                           f"Estado final: {summary['final_health'].upper()}")
         
         # Mantener la visualización de la ruta recorrida
         # No limpiar el path para que las flechas sigan mostrándose
         # self.route_controller._clear_current_path()  # Comentado para mantener visualización
     
+    def _on_journey_error(self, e: Exception):
+        """Report an error raised while simulating or playing the journey."""
+        from tkinter import messagebox
+        
+        error_msg = f"\n❌ ERROR DURANTE EL VIAJE: {str(e)}"
+        self.burro_controller.append_status_message(error_msg)
+        self.request_display_update()
+        messagebox.showerror("Error", f"Error durante la simulación: {str(e)}")
+    
     def _display_journey_step(self, step, step_index: int):
-        """Muestra los detalles de un paso del viaje."""
+        """Muestra los detalles de un paso del viaje (una sola escritura al widget)."""
+        parts = []
+        
         # Mensaje de llegada
         if step_index == 0:
             arrival_msg = f"\n🎯 LLEGANDO A ESTRELLA INICIAL: {step.star.label}"
@@ -253,7 +356,7 @@ class GalaxiasGUI:
                 prev_step = None  # Se podría pasar como parámetro si es necesario
             arrival_msg = f"\n📍 LLEGANDO A: {step.star.label}"
         
-        self.burro_controller.append_status_message(arrival_msg)
+        parts.append(arrival_msg)
         
         # Estado al llegar
         status_msg = (f"\n📊 ESTADO AL LLEGAR:"
@@ -261,14 +364,14 @@ class GalaxiasGUI:
                      f"\n   🌾 Pasto: {step.grass_on_arrival:.1f} kg"
                      f"\n   💚 Salud: {step.health_on_arrival.upper()}"
                      f"\n   ⏰ Vida restante: {step.life_remaining_on_arrival:.1f} años")
-        self.burro_controller.append_status_message(status_msg)
+        parts.append(status_msg)
         
         # Análisis de tiempo
         time_msg = (f"\n⏱️ ANÁLISIS DE TIEMPO EN ESTRELLA:"
                    f"\n   🏠 Tiempo total de estadía: {step.total_stay_time:.2f}"
                    f"\n   🍽️ Tiempo disponible para comer: {step.eating_time_available:.2f}"
                    f"\n   🔬 Tiempo para investigación: {step.research_time:.2f}")
-        self.burro_controller.append_status_message(time_msg)
+        parts.append(time_msg)
         
         # Decisión y acción de comer
         if step.should_eat:
@@ -283,20 +386,20 @@ class GalaxiasGUI:
         else:
             eat_msg = f"\n⚡ NO NECESITA COMER - Energía ≥ 50%"
         
-        self.burro_controller.append_status_message(eat_msg)
+        parts.append(eat_msg)
         
         # Investigación
         research_msg = (f"\n🔬 INVESTIGACIÓN:"
                        f"\n   📉 Energía consumida: -{step.energy_consumed_research:.1f}%"
                        f"\n   🕰️ Efecto en vida: {step.life_effect_research:+.2f} años")
-        self.burro_controller.append_status_message(research_msg)
+        parts.append(research_msg)
         
         # Efectos de hipergigante
         if step.is_hypergiant:
             hyper_msg = (f"\n🌟 ESTRELLA HIPERGIGANTE:"
                         f"\n   ⚡ Bonus energía (+50%): +{step.hypergiant_energy_bonus:.1f}%"
                         f"\n   🌾 Pasto duplicado: +{step.hypergiant_grass_bonus:.1f} kg")
-            self.burro_controller.append_status_message(hyper_msg)
+            parts.append(hyper_msg)
         
         # Estado final
         final_msg = (f"\n✅ ESTADO DESPUÉS DE {step.star.label}:"
@@ -305,16 +408,29 @@ class GalaxiasGUI:
                     f"\n   💚 Salud final: {step.health_after_star.upper()}"
                     f"\n   ⏰ Vida restante: {step.life_remaining_after_star:.1f} años"
                     f"\n   {'─'*50}")
-        self.burro_controller.append_status_message(final_msg)
+        parts.append(final_msg)
+        
+        self.burro_controller.append_status_message("".join(parts))
     
     def _generate_report(self):
-        """Generate visual journey report."""
+        """
+        Generate visual journey report.
+        
+        The figure is rendered and saved in the route worker thread; only the
+        report window is created on the Tk thread.
+        """
         path_stats = self.route_controller.get_current_path_stats()
-        self.visualization_controller.generate_report(path_stats)
+        self.route_controller.run_in_background(
+            "Generando reporte...",
+            lambda: self.visualization_controller.render_report(path_stats),
+            self.visualization_controller.show_report,
+            on_error=self.visualization_controller.report_error)
 
 
 def main():
     """Main entry point for the GUI application."""
+    # Se fija aquí y no al importar: los usos sin pantalla (reportes a PNG) siguen con Agg
+    matplotlib.use(MATPLOTLIB_BACKEND)
     root = tk.Tk()
     app = GalaxiasGUI(root)
     root.mainloop()
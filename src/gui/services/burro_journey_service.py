@@ -20,6 +20,12 @@ class BurroJourneyService:
         self.research_params = research_params  # Puede ser None si no se usa
         # Cargar configuración del JSON
         self._load_json_config()
+        # Distancias de los enlaces, indexadas una sola vez: (ID origen, starId destino) -> distancia
+        self._edge_dist: Dict[Tuple[str, int], float] = {}
+        for star in self.space_map.get_all_stars_list():
+            for route_info in star.linked_to:
+                self._edge_dist.setdefault((star.id, route_info.get('starId')),
+                                           float(route_info.get('distance', 0)))
     
     def _load_json_config(self):
         """Carga la configuración inicial del JSON."""
@@ -195,12 +201,13 @@ class BurroJourneyService:
             current_age = burro.current_age
             # Calcular vida restante según edad actual
             current_life = self.death_age - current_age
+            # Saltos del camino resueltos una sola vez antes de simular
+            hops = self.get_path_hops(path)
             journey_steps = []
             for i, star in enumerate(path):
                 try:
                     if i > 0:
-                        prev_star = path[i-1]
-                        travel_distance = self._get_travel_distance(prev_star, star)
+                        travel_distance = hops[i - 1][2]
                         if travel_distance:
                             energy_cost, life_cost = self.calculate_travel_cost(travel_distance, current_age)
                             current_energy = max(0.0, current_energy - energy_cost)
@@ -232,13 +239,13 @@ class BurroJourneyService:
             print(f"Error general en simulate_journey: {e}")
             return []
     
+    def get_path_hops(self, path: List[Star]) -> List[Tuple[Star, Star, Optional[float]]]:
+        """Realiza el camino como lista de saltos (origen, destino, distancia o None)."""
+        return [(a, b, self._get_travel_distance(a, b)) for a, b in zip(path, path[1:])]
+    
     def _get_travel_distance(self, from_star: Star, to_star: Star) -> Optional[float]:
         """Obtiene la distancia de viaje entre dos estrellas."""
-        for route_info in from_star.linked_to:
-            # route_info es un dict con keys como 'starId', 'distance'
-            if route_info.get('starId') == int(to_star.id):
-                return float(route_info.get('distance', 0))
-        return None
+        return self._edge_dist.get((from_star.id, int(to_star.id)))
     
     def reset_burro_to_json_values(self, burro: BurroAstronauta):
         """Resetea el burro a los valores iniciales del JSON."""
@@ -2,6 +2,7 @@
 Configuration service implementation.
 Implements Single Responsibility Principle for configuration management.
 """
+import copy
 from typing import Dict, Any
 from ...utils import JSONHandler
 
@@ -15,7 +16,8 @@ class ConfigurationService:
     def load_configuration(self, config_path: str) -> Dict[str, Any]:
         """Load configuration from file."""
         try:
-            self._config = JSONHandler.load_json(config_path)
+            # Copia propia del JSON cacheado: el archivo se parsea una vez por versión
+            self._config = copy.deepcopy(JSONHandler.load_json_cached(config_path))
             return self._config
         except Exception as e:
             raise Exception(f"Failed to load configuration: {str(e)}")
@@ -2,7 +2,7 @@
 Route service implementation.
 Implements Single Responsibility Principle for route operations.
 """
-from typing import List, Tuple, Optional, Dict, Any
+from typing import Callable, List, Tuple, Optional, Dict, Any
 from ...core import SpaceMap, Star, BurroAstronauta
 from ...algorithms import RouteCalculator, DonkeyRouteOptimizer
 from ..interfaces.route_service_interface import IRouteService
@@ -19,42 +19,40 @@ class RouteService(IRouteService):
     
     def calculate_optimal_route(self, start: Star, end: Star) -> Tuple[Optional[List[Star]], Optional[Dict[str, Any]]]:
         """Calculate optimal route between two stars."""
-        try:
+        def solve():
             path, cost = self.calculator.dijkstra(start, end)
-            
             if not path:
                 return None, {"error": "No route found"}
-            
             stats = self.calculator.calculate_path_stats(path)
             stats['cost'] = cost
-            
             return path, stats
-        except Exception as e:
-            return None, {"error": str(e)}
+        
+        return self._run_solver(solve, lambda path, stats: not path)
     
     def calculate_max_visit_route(self, start: Star) -> Tuple[Optional[List[Star]], Optional[Dict[str, Any]]]:
         """Calculate route that maximizes star visits."""
-        try:
-            path, stats = self.calculator.find_max_visit_route_from_json(start)
-            
-            if stats.get('error'):
-                return None, stats
-            
-            return path, stats
-        except Exception as e:
-            return None, {"error": str(e)}
+        return self._run_solver(
+            lambda: self.calculator.find_max_visit_route_from_json(start),
+            lambda path, stats: bool(stats.get('error')))
     
     def calculate_min_cost_route(self, start: Star, research_params=None) -> Tuple[Optional[List[Star]], Optional[Dict[str, Any]]]:
         """Calculate minimum cost route."""
+        return self._run_solver(
+            lambda: self.calculator.find_min_cost_route_from_json(start, research_params),
+            lambda path, stats: not path or 'error' in stats)
+    
+    @staticmethod
+    def _run_solver(solve: Callable[[], Tuple[Optional[List[Star]], Dict[str, Any]]],
+                    failed: Callable[[Optional[List[Star]], Dict[str, Any]], bool]
+                    ) -> Tuple[Optional[List[Star]], Optional[Dict[str, Any]]]:
+        """Run a route solver; failures and exceptions come back as (None, stats)."""
         try:
-            path, stats = self.calculator.find_min_cost_route_from_json(start, research_params)
-            
-            if not path or 'error' in stats:
-                return None, stats
-            
-            return path, stats
+            path, stats = solve()
         except Exception as e:
             return None, {"error": str(e)}
+        if failed(path, stats):
+            return None, stats
+        return path, stats
     
     def calculate_path_stats(self, path: List[Star]) -> Dict[str, Any]:
         """Calculate statistics for a given path."""
@@ -2,11 +2,11 @@
 Visualization service implementation.
 Implements Single Responsibility Principle for visualization operations.
 """
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import matplotlib.pyplot as plt
 import matplotlib.figure
 from ...core import SpaceMap, Star, BurroAstronauta
-from ...presentation import SpaceVisualizer
+from ...presentation import SpaceVisualizer, MapOverlay
 from ..interfaces.visualization_service_interface import IVisualizationService
 
 
@@ -16,22 +16,58 @@ class VisualizationService(IVisualizationService):
     def __init__(self, space_map: SpaceMap):
         self.space_map = space_map
         self.visualizer = SpaceVisualizer(space_map)
+        # Mapa interactivo: la capa estática se reconstruye solo si cambia el mapa
+        self._figure: Optional[matplotlib.figure.Figure] = None
+        self._overlay: Optional[MapOverlay] = None
+        self._static_key: Optional[Tuple] = None
+        self._overlay_key: Optional[str] = None
     
     def update_visualization(self, path: Optional[List[Star]] = None, 
                            burro_location: Optional[Star] = None) -> matplotlib.figure.Figure:
-        """Update the space map visualization."""
-        fig = self.visualizer.plot_space_map(
-            highlight_path=path,
-            donkey_location=burro_location,
-            show=False
+        """
+        Update the space map visualization.
+        
+        Always returns the same figure: the static layer (which includes the
+        highlighted path) is redrawn into its axes only when stars, routes,
+        comets or the path change (leaving the figure stale), otherwise just
+        the animated donkey artists are moved.
+        """
+        static_key = self._get_static_key(path)
+        if self._figure is None:
+            self._figure, self._overlay = self.visualizer.create_interactive_map(path)
+            self._static_key = static_key
+        elif static_key != self._static_key:
+            self._overlay = self.visualizer.render_into(self._figure.axes[0], path)
+            self._static_key = static_key
+        self._overlay.update(burro_location)
+        self._overlay_key = self._get_overlay_key(burro_location)
+        return self._figure
+    
+    def is_current(self, path: Optional[List[Star]] = None,
+                   burro_location: Optional[Star] = None) -> bool:
+        """Whether the shown figure already has this path, donkey position and static layer."""
+        return (self._figure is not None and
+                self._overlay_key == self._get_overlay_key(burro_location) and
+                self._static_key == self._get_static_key(path))
+    
+    @staticmethod
+    def _get_overlay_key(burro_location: Optional[Star]) -> Optional[str]:
+        """Visible state of the animated layer."""
+        return burro_location.id if burro_location else None
+    
+    def _get_static_key(self, path: Optional[List[Star]]) -> Tuple:
+        """Everything drawn in the static layer: star energies, blocked routes, comets, path."""
+        return (
+            tuple((star.id, star.amount_of_energy) for star in self.space_map.get_all_stars_list()),
+            tuple(i for i, route in enumerate(self.space_map.routes) if route.blocked),
+            tuple((comet.name, tuple(comet.blocked_routes)) for comet in self.space_map.comets),
+            tuple(star.id for star in path) if path else ()
         )
-        return fig
     
-    def generate_journey_report(self, burro: BurroAstronauta, stats: dict) -> None:
-        """Generate visual journey report."""
-        self.visualizer.plot_journey_report(
+    def generate_journey_report(self, burro: BurroAstronauta, stats: dict) -> matplotlib.figure.Figure:
+        """Render and save the journey report; safe to call from a worker thread."""
+        return self.visualizer.render_journey_report(
             burro,
             stats,
-            save_path='assets/journey_report.png',
-            show=True
+            save_path='assets/journey_report.png'
         )
\ No newline at end of file
@@ -6,7 +6,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 from typing import List, Tuple, Callable
 from ..core import Comet
-from ..core.comet_impact_system import CometImpactManager, RouteImpactResult
+from ..core.comet_impact_system import CometImpactManager, RouteImpactResult, JOURNEY_UNKNOWN
 
 
 class CometManager:
@@ -20,6 +20,9 @@ class CometManager:
         # Sistema de análisis de impacto (puede ser reemplazado externamente)
         self.comet_impact_manager = None  # Se inicializa en create_ui o externamente
         
+        # Texto del combo -> ID de estrella (se llena en create_ui)
+        self._id_by_display = {}
+        
     def create_ui(self, parent_frame):
         """Crea la interfaz de gestión de cometas."""
         # Inicializar variables Tkinter
@@ -63,8 +66,9 @@ class CometManager:
         self.to_star_var = tk.StringVar()
         
         # Combos para seleccionar estrellas
-        star_ids = [star.id for star in self.space_map.get_all_stars_list()]
-        star_labels = [f"{star.id} ({star.label})" for star in self.space_map.get_all_stars_list()]
+        stars = self.space_map.get_all_stars_list()
+        star_labels = tuple(f"{star.id} ({star.label})" for star in stars)  # Compartida por ambos combos
+        self._id_by_display = {text: star.id for text, star in zip(star_labels, stars)}
         
         tk.Label(route_frame, text="Desde:", bg='#001122', fg='white', font=('Arial', 8)).pack(side=tk.LEFT)
         self.from_combo = ttk.Combobox(route_frame, textvariable=self.from_star_var,
@@ -131,6 +135,9 @@ class CometManager:
         """Extrae el ID de estrella del texto del combo."""
         if not combo_text:
             return ""
+        star_id = self._id_by_display.get(combo_text)
+        if star_id is not None:
+            return star_id
         # Formato: "id (label)"
         if " (" in combo_text:
             return combo_text.split(" (")[0]
@@ -247,6 +254,7 @@ class CometManager:
             self.comet_listbox.insert(0, "--- No hay cometas activos ---")
             return
         
+        entries = []
         for comet in self.space_map.comets:
             routes_info = []
             for from_id, to_id in comet.blocked_routes:
@@ -259,7 +267,8 @@ class CometManager:
             routes_text = ", ".join(routes_info)
             display_text = f"{comet.name}: {routes_text}"
             
-            self.comet_listbox.insert(tk.END, display_text)
+            entries.append(display_text)
+        self.comet_listbox.insert(tk.END, *entries)
     
     def clear_inputs(self):
         """Limpia los campos de entrada."""
@@ -276,7 +285,7 @@ class CometManager:
         }
     
     def register_active_journey(self, planned_path: List, current_position: int = 0, 
-                               journey_type: str = "unknown") -> None:
+                               journey_type: str = JOURNEY_UNKNOWN) -> None:
         """Registra un viaje activo que puede ser afectado por cometas."""
         if self.comet_impact_manager:
             self.comet_impact_manager.register_active_journey(planned_path, current_position, journey_type)
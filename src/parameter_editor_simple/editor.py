@@ -502,8 +502,7 @@ class ResearchParameterEditor:
             
             # Actualizar descripción
             formatted_text = self.preset_manager.format_preset_applied_text(preset_name, config)
-            self.preset_desc_text.delete('1.0', tk.END)
-            self.preset_desc_text.insert('1.0', formatted_text)
+            self.preset_desc_text.replace('1.0', tk.END, formatted_text)
     
     def _reset_to_defaults(self):
         """Resetea todos los parámetros a valores por defecto."""
@@ -11,6 +11,8 @@ class PresetManager:
     def __init__(self):
         """Inicializa el gestor con presets predefinidos."""
         self._presets = self._load_default_presets()
+        # Texto JSON ya formateado por preset: nombre -> (configuración, texto)
+        self._applied_text_cache: Dict[str, Tuple[Dict, str]] = {}
     
     def get_presets(self) -> List[Tuple[str, Dict]]:
         """
@@ -120,5 +122,10 @@ class PresetManager:
         Returns:
             Texto formateado para mostrar al usuario
         """
-        return (f"✅ Preset aplicado: {preset_name}\n\n" + 
-                json.dumps(config, indent=2, ensure_ascii=False))
\ No newline at end of file
+        cached = self._applied_text_cache.get(preset_name)
+        if cached is not None and cached[0] == config:
+            return cached[1]
+        text = (f"✅ Preset aplicado: {preset_name}\n\n" + 
+                json.dumps(config, indent=2, ensure_ascii=False))
+        self._applied_text_cache[preset_name] = (dict(config), text)
+        return text
\ No newline at end of file
@@ -55,21 +55,22 @@ class PreviewGenerator:
     
     def _format_star_configs(self, params) -> str:
         """Formatea las configuraciones específicas por estrella."""
-        star_text = "⭐ CONFIGURACIONES ESPECÍFICAS POR ESTRELLA:\n"
+        parts = ["⭐ CONFIGURACIONES ESPECÍFICAS POR ESTRELLA:\n"]
         
         if params.custom_star_settings:
             for star_id, config in params.custom_star_settings.items():
                 star_name = self._get_star_name(star_id)
-                star_text += (
+                parts.append(
                     f"\n   🌟 {star_name} (ID: {star_id}):\n"
                     f"      ⚡ Consumo: {config.get('energy_rate', 'default'):.1f}%\n"
                     f"      💫 Bonus tiempo: {config.get('time_bonus', 'default'):+.1f}a\n"
                     f"      🔋 Bonus energía: {config.get('energy_bonus', 'default'):+.1f}%\n"
                 )
         else:
-            star_text += "\n   (Ninguna configuración específica - usando valores generales)\n"
+            parts.append("\n   (Ninguna configuración específica - usando valores generales)\n")
         
-        return star_text + "\n"
+        parts.append("\n")
+        return "".join(parts)
     
     def _format_impact_estimates(self, params) -> str:
         """Formatea las estimaciones de impacto."""
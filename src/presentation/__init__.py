@@ -7,13 +7,14 @@ Contains components for:
 - GUI components and utilities
 - Journey reports and charts
 """
-from .visualizer import SpaceVisualizer
+from .visualizer import SpaceVisualizer, MapOverlay
 from .life_monitor import LifeMonitor
 from .gui_life_monitor import TkinterAlertSystem, GuiLifeStatusWidget
 from .gui_hypergiant_jump import HyperGiantJumpGUI
 
 __all__ = [
     'SpaceVisualizer',
+    'MapOverlay',
     'LifeMonitor',
     'TkinterAlertSystem',
     'GuiLifeStatusWidget', 
@@ -169,7 +169,9 @@ class HyperGiantJumpGUI:
         if not accessible_hypergiants:
             self.hg_listbox.insert(tk.END, "❌ No hay hipergigantes accesibles")
             return
-            
+        
+        # Se acumulan las entradas y se insertan en una sola llamada al Listbox
+        entries = []
         for i, (hypergiant, distance) in enumerate(accessible_hypergiants):
             # Calcular costo energético
             age_factor = max(1.0, (self.burro.current_age - 5) / 10.0)
@@ -185,10 +187,11 @@ class HyperGiantJumpGUI:
                     f"Distancia: {distance:.1f} | "
                     f"Energía: -{energy_cost}%")
             
-            self.hg_listbox.insert(tk.END, entry)
+            entries.append(entry)
             
             # Almacenar datos para referencia
-            self.hg_listbox.insert(tk.END, f"    ID: {hypergiant.id} | Coordenadas: ({hypergiant.x}, {hypergiant.y})")
+            entries.append(f"    ID: {hypergiant.id} | Coordenadas: ({hypergiant.x}, {hypergiant.y})")
+        self.hg_listbox.insert(tk.END, *entries)
         
         # Cargar destinos de la constelación objetivo
         self._update_destination_options()
@@ -200,12 +203,13 @@ class HyperGiantJumpGUI:
         target_constellation = self.jump_system.get_star_constellation(self.current_to_star)
         destinations = self.jump_system.find_destination_options(target_constellation)
         
-        for dest in destinations:
-            entry = (f"⭐ {dest.label} | "
+        entries = [(f"⭐ {dest.label} | "
                     f"ID: {dest.id} | "
                     f"Coordenadas: ({dest.x}, {dest.y}) | "
                     f"Energía: {dest.amount_of_energy}")
-            self.dest_listbox.insert(tk.END, entry)
+                   for dest in destinations]
+        if entries:
+            self.dest_listbox.insert(tk.END, *entries)
             
     def _on_hypergiant_selected(self, event):
         """Maneja la selección de una hipergigante."""
@@ -372,19 +376,19 @@ def integrate_hypergiant_jump_to_gui(gui_instance, space_map: SpaceMap, burro: B
     """
     # Crear instancia del sistema de saltos
     jump_gui = HyperGiantJumpGUI(gui_instance.root, space_map, burro)
+    # Un solo sistema (mapa de constelaciones) compartido por todas las verificaciones
+    jump_system = HyperGiantJumpSystem(space_map)
     
     # Agregar método a la GUI principal
     def check_and_handle_hypergiant_jump(from_star, to_star):
         """Verifica si se necesita salto hipergigante y maneja el proceso."""
-        jump_system = HyperGiantJumpSystem(space_map)
-        
         if jump_system.requires_hypergiant_jump(from_star, to_star):
             return jump_gui.show_jump_planner(from_star, to_star)
         return False
     
     # Inyectar el método en la GUI principal
     gui_instance.check_hypergiant_jump = check_and_handle_hypergiant_jump
-    gui_instance.jump_system = HyperGiantJumpSystem(space_map)
+    gui_instance.jump_system = jump_system
     
     return jump_gui
 
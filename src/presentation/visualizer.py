@@ -3,10 +3,14 @@ Visualization module for displaying the space map and routes.
 """
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
+from matplotlib.figure import Figure
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
+import numpy as np
 from matplotlib.backends.backend_agg import FigureCanvasAgg
 from typing import List, Optional, Dict, Set, Tuple
 from ..core import Star, Route, SpaceMap, BurroAstronauta
-import json
+from ..utils.json_handler import JSONHandler
 import hashlib
 
 
@@ -24,6 +28,8 @@ class SpaceVisualizer:
         # Sistema avanzado de colores por constelación
         self.constellation_colors = self._generate_constellation_colors()
         self.shared_coordinates = self._find_shared_coordinates()
+        # Mapa estrella_id -> constelación, para colorear sin releer el JSON por estrella
+        self._star_constellation = self._build_star_constellation_map()
         
         # Color especial para estrellas compartidas
         self.shared_star_color = '#d62728'  # rojo intenso
@@ -87,8 +93,7 @@ class SpaceVisualizer:
             Dict[str, str]: Mapeo de nombre_constelación -> color_hex
         """
         try:
-            with open('data/constellations.json', 'r') as f:
-                data = json.load(f)
+            data = JSONHandler.load_json_cached('data/constellations.json')
             
             color_mapping = {}
             
@@ -110,8 +115,7 @@ class SpaceVisualizer:
             Set[Tuple[float, float]]: Conjunto de coordenadas con estrellas compartidas
         """
         try:
-            with open('data/constellations.json', 'r') as f:
-                data = json.load(f)
+            data = JSONHandler.load_json_cached('data/constellations.json')
             
             coordinate_counts = {}
             
@@ -130,6 +134,26 @@ class SpaceVisualizer:
             print(f"Error encontrando coordenadas compartidas: {e}")
             return set()
     
+    def _build_star_constellation_map(self) -> Dict[str, str]:
+        """
+        Construye el mapeo estrella_id -> nombre de constelación.
+        
+        Una estrella compartida queda asociada a la primera constelación
+        del JSON que la contiene.
+        """
+        try:
+            data = JSONHandler.load_json_cached('data/constellations.json')
+            
+            star_constellation = {}
+            for constellation in data.get('constellations', []):
+                for star_data in constellation.get('starts', []):
+                    star_constellation.setdefault(str(star_data['id']), constellation['name'])
+            
+            return star_constellation
+        except Exception as e:
+            print(f"Error construyendo mapa de constelaciones: {e}")
+            return {}
+    
     def _get_star_constellation(self, star: Star) -> Optional[str]:
         """
         Obtiene el nombre de la constelación a la que pertenece una estrella.
@@ -140,19 +164,7 @@ class SpaceVisualizer:
         Returns:
             Optional[str]: Nombre de la constelación o None si no se encuentra
         """
-        try:
-            with open('data/constellations.json', 'r') as f:
-                data = json.load(f)
-            
-            for constellation in data.get('constellations', []):
-                for star_data in constellation.get('starts', []):
-                    if str(star_data['id']) == str(star.id):
-                        return constellation['name']
-            
-            return None
-        except Exception as e:
-            print(f"Error obteniendo constelación de estrella {star.id}: {e}")
-            return None
+        return self._star_constellation.get(str(star.id))
     
     def _determine_star_color(self, star: Star) -> str:
         """
@@ -189,7 +201,8 @@ class SpaceVisualizer:
                        highlight_path: Optional[List[Star]] = None,
                        donkey_location: Optional[Star] = None,
                        save_path: Optional[str] = None,
-                       show: bool = True) -> plt.Figure:
+                       show: bool = True,
+                       ax: Optional[plt.Axes] = None) -> plt.Figure:
         """
         Plot the entire space map with stars and routes.
         
@@ -198,8 +211,64 @@ class SpaceVisualizer:
             donkey_location: Current location of the donkey
             save_path: If provided, save the figure to this path
             show: Whether to display the plot
+            ax: Existing axes to clear and redraw into instead of a new figure
+        """
+        if ax is not None:
+            ax.clear()
+            self._draw_map_layers(ax, highlight_path, donkey_location)
+            fig = ax.figure
+        else:
+            fig, ax = self._draw_space_map(highlight_path, donkey_location)
+        
+        if save_path:
+            fig.savefig(save_path, facecolor=fig.get_facecolor(), dpi=150)
+        
+        if show:
+            plt.show()
+        
+        return fig
+    
+    def create_interactive_map(self, highlight_path: Optional[List[Star]] = None
+                               ) -> Tuple[plt.Figure, 'MapOverlay']:
         """
+        Build the static map (stars, routes, comets, highlighted path) once,
+        plus animated artists for the donkey marker.
+        
+        The animated artists are skipped by a normal canvas draw, so the
+        embedding canvas can cache the static background and blit only them.
+        The path stays in the static layer so its arrows keep their place
+        below the star markers and labels.
+        
+        Returns:
+            Tuple (figure, overlay) where overlay updates the animated artists
+        """
+        # Figure sin pyplot: no queda registrada en el gestor de figuras,
+        # así que no hace falta plt.close() al incrustarla
+        fig = Figure(figsize=(12, 10))
+        return fig, self.render_into(fig.add_subplot(), highlight_path)
+    
+    def render_into(self, ax: plt.Axes,
+                    highlight_path: Optional[List[Star]] = None) -> 'MapOverlay':
+        """
+        Redraw the static map into an existing axes and return a fresh overlay.
+        
+        Lets an embedded figure follow map changes (energy, comets, a new
+        path) without creating a new figure and canvas.
+        """
+        self.plot_space_map(highlight_path=highlight_path, show=False, ax=ax)
+        return MapOverlay(ax)
+    
+    def _draw_space_map(self, highlight_path: Optional[List[Star]],
+                        donkey_location: Optional[Star]) -> Tuple[plt.Figure, plt.Axes]:
+        """Draw the full space map on a new figure and return (fig, ax)."""
         fig, ax = plt.subplots(figsize=(12, 10))
+        self._draw_map_layers(ax, highlight_path, donkey_location)
+        return fig, ax
+    
+    def _draw_map_layers(self, ax: plt.Axes, highlight_path: Optional[List[Star]],
+                         donkey_location: Optional[Star]):
+        """Draw stars, routes, comets, path and donkey into the given axes."""
+        fig = ax.figure
         
         # Configurar límites mínimos del tablero para cumplir requisitos de 200x200
         stars = self.space_map.get_all_stars_list()
@@ -236,10 +305,9 @@ class SpaceVisualizer:
                 blocked_routes.add((from_id, to_id))
                 blocked_routes.add((to_id, from_id))  # Bidirectional blocking
         
+        # Todas las rutas en una sola LineCollection (un artista, estilo por segmento)
+        colors, widths, styles = [], [], []
         for route in self.space_map.routes:
-            x1, y1 = route.from_star.x, route.from_star.y
-            x2, y2 = route.to_star.x, route.to_star.y
-            
             # Check if route is blocked by comets
             route_key = (route.from_star.id, route.to_star.id)
             route_key_reverse = (route.to_star.id, route.from_star.id)
@@ -247,10 +315,10 @@ class SpaceVisualizer:
             
             if route.blocked or is_blocked_by_comet:
                 # Blocked routes in red dashed with thicker lines for comet blocks
-                line_style = 'r--'
-                line_width = 3 if is_blocked_by_comet else 1
                 alpha = 0.7 if is_blocked_by_comet else 0.3
-                ax.plot([x1, x2], [y1, y2], line_style, alpha=alpha, linewidth=line_width)
+                colors.append(to_rgba('red', alpha))
+                widths.append(3 if is_blocked_by_comet else 1)
+                styles.append('--')
             else:
                 # Normal routes - color by danger level
                 if route.danger_level <= 1:
@@ -262,8 +330,15 @@ class SpaceVisualizer:
                 else:
                     color = 'red'
                 
-                alpha = 0.3 + (route.danger_level * 0.1)
-                ax.plot([x1, x2], [y1, y2], color, alpha=alpha, linewidth=1)
+                colors.append(to_rgba(color, min(1.0, 0.3 + (route.danger_level * 0.1))))
+                widths.append(1)
+                styles.append('-')
+        
+        if self.space_map.routes:
+            ax.add_collection(LineCollection(self.space_map.route_arrays['segments'],
+                                             colors=colors, linewidths=widths,
+                                             linestyles=styles, zorder=2),
+                              autolim=False)
         
         # Highlight path if provided
         if highlight_path and len(highlight_path) > 1:
@@ -278,21 +353,20 @@ class SpaceVisualizer:
                             head_width=8, head_length=6, 
                             fc='cyan', ec='cyan', alpha=0.6)
         
-        # Plot stars
-        for star in self.space_map.get_all_stars_list():
-            # Usar el nuevo sistema de colores
-            color = self._determine_star_color(star)
-            size = max(100, star.radius * 300)  # Size based on radius
-            
-            # Highlight if in path
-            if highlight_path and star in highlight_path:
-                size *= 1.5
-                ax.scatter(star.x, star.y, s=size, c=color, 
-                          edgecolors='cyan', linewidth=3, zorder=5)
-            else:
-                ax.scatter(star.x, star.y, s=size, c=color, 
-                          edgecolors='white', linewidth=1, zorder=5)
-            
+        # Plot stars: un único scatter sobre los arreglos precalculados del mapa
+        stars = self.space_map.get_all_stars_list()
+        if stars:
+            path_ids = {star.id for star in highlight_path} if highlight_path else set()
+            in_path = np.array([star.id in path_ids for star in stars], dtype=bool)
+            sizes = np.maximum(100, self.space_map.star_arrays['radius'] * 300)
+            sizes[in_path] *= 1.5
+            xy = self.space_map.star_arrays['xy']
+            ax.scatter(xy[:, 0], xy[:, 1], s=sizes,
+                       c=[self._determine_star_color(star) for star in stars],
+                       edgecolors=np.where(in_path, 'cyan', 'white'),
+                       linewidths=np.where(in_path, 3, 1), zorder=5)
+        
+        for star in stars:
             # Add star label
             ax.annotate(f"{star.label}\nE:{star.amount_of_energy}", 
                        (star.x, star.y), 
@@ -399,15 +473,7 @@ class SpaceVisualizer:
         ax.tick_params(colors='white')
         ax.grid(True, alpha=0.2, color='white')
         
-        plt.tight_layout()
-        
-        if save_path:
-            plt.savefig(save_path, facecolor=fig.get_facecolor(), dpi=150)
-        
-        if show:
-            plt.show()
-        
-        return fig
+        fig.tight_layout()
     
     def plot_resource_status(self, 
                             burro: BurroAstronauta,
@@ -466,6 +532,36 @@ class SpaceVisualizer:
                            show: bool = True) -> plt.Figure:
         """Generate a comprehensive journey report."""
         fig = plt.figure(figsize=(14, 8))
+        self._draw_journey_report(fig, burro, path_stats)
+        
+        if save_path:
+            plt.savefig(save_path, facecolor=fig.get_facecolor(), dpi=150)
+        
+        if show:
+            plt.show()
+        
+        return fig
+    
+    def render_journey_report(self,
+                              burro: BurroAstronauta,
+                              path_stats: Dict,
+                              save_path: Optional[str] = None) -> Figure:
+        """
+        Render the journey report on a figure outside pyplot.
+        
+        No pyplot state is touched, so it can run in a worker thread; the
+        caller embeds the returned figure in its own window.
+        """
+        fig = Figure(figsize=(14, 8))
+        self._draw_journey_report(fig, burro, path_stats)
+        
+        if save_path:
+            fig.savefig(save_path, facecolor=fig.get_facecolor(), dpi=150)
+        
+        return fig
+    
+    def _draw_journey_report(self, fig: Figure, burro: BurroAstronauta, path_stats: Dict):
+        """Draw the four report panels (path, resources, stats, status) into fig."""
         gs = fig.add_gridspec(2, 2, hspace=0.3, wspace=0.3)
         
         # Top left: Path information
@@ -530,14 +626,15 @@ class SpaceVisualizer:
         ax3 = fig.add_subplot(gs[1, 0])
         ax3.axis('off')
         
-        history_text = "HISTORIAL DE VIAJE\n" + "="*40 + "\n\n"
+        history_lines = ["HISTORIAL DE VIAJE\n" + "="*40 + "\n\n"]
         if burro.journey_history:
             for i, star in enumerate(burro.journey_history, 1):
                 star_type = "⭐" if star.hypergiant else "✨"
-                history_text += f"{i}. {star_type} {star.label}\n"
-                history_text += f"   Energía: {star.amount_of_energy}, Radio: {star.radius:.1f}\n"
+                history_lines.append(f"{i}. {star_type} {star.label}\n"
+                                     f"   Energía: {star.amount_of_energy}, Radio: {star.radius:.1f}\n")
         else:
-            history_text += "Sin historial de viaje aún."
+            history_lines.append("Sin historial de viaje aún.")
+        history_text = "".join(history_lines)
         
         ax3.text(0.05, 0.95, history_text, transform=ax3.transAxes,
                 fontsize=9, verticalalignment='top',
@@ -579,11 +676,28 @@ class SpaceVisualizer:
         fig.patch.set_facecolor('#000033')
         fig.suptitle('Galaxias - Reporte de Viaje del Burro Astronauta',
                     color='white', fontsize=16, fontweight='bold')
-        
-        if save_path:
-            plt.savefig(save_path, facecolor=fig.get_facecolor(), dpi=150)
-        
-        if show:
-            plt.show()
-        
-        return fig
+
+
+class MapOverlay:
+    """Animated artists drawn over the static space map (the donkey)."""
+    
+    def __init__(self, ax: plt.Axes):
+        self.ax = ax
+        self.donkey_marker = ax.scatter([], [], s=400, marker='*', c='gold',
+                                        edgecolors='orange', linewidth=2, zorder=10, animated=True)
+        self.donkey_label = ax.annotate('Burro Astronauta', (0, 0),
+                                        xytext=(10, -20), textcoords='offset points',
+                                        fontsize=10, color='gold', fontweight='bold',
+                                        bbox=dict(boxstyle='round,pad=0.5',
+                                                  facecolor='darkblue', alpha=0.8),
+                                        zorder=10, animated=True, visible=False)
+    
+    def update(self, donkey_location: Optional[Star] = None):
+        """Move the animated artists to the given donkey location."""
+        if donkey_location:
+            self.donkey_marker.set_offsets([[donkey_location.x, donkey_location.y]])
+            self.donkey_label.xy = (donkey_location.x, donkey_location.y)
+            self.donkey_label.set_visible(True)
+        else:
+            self.donkey_marker.set_offsets(np.empty((0, 2)))
+            self.donkey_label.set_visible(False)
@@ -4,7 +4,23 @@ Centralizes all JSON reading/writing operations.
 """
 import json
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+try:
+    import orjson  # Opcional: parser en C, más rápido que json
+except ImportError:
+    orjson = None
+
+# Caché de solo lectura: ruta absoluta -> ((mtime_ns, tamaño), datos)
+_JSON_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+
+def _parse_json_bytes(raw: bytes) -> Any:
+    """Parse JSON bytes with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class JSONHandler:
     """Centralized JSON file operations."""
@@ -13,13 +29,33 @@ class JSONHandler:
     def load_json(file_path: str) -> Dict[str, Any]:
         """Load JSON file with error handling."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(file_path, 'rb') as f:
+                return _parse_json_bytes(f.read())
         except FileNotFoundError:
             raise FileNotFoundError(f"JSON file not found: {file_path}")
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in {file_path}: {e}")
     
+    @staticmethod
+    def load_json_cached(file_path: str) -> Dict[str, Any]:
+        """
+        Load a JSON file, reusing the parsed data while the file is unchanged.
+        
+        The returned dict is shared between callers and must not be modified.
+        """
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"JSON file not found: {file_path}")
+        key = os.path.abspath(file_path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _JSON_CACHE.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        data = JSONHandler.load_json(file_path)
+        _JSON_CACHE[key] = (stamp, data)
+        return data
+    
     @staticmethod
     def save_json(data: Dict[str, Any], file_path: str) -> None:
         """Save data to JSON file."""
@@ -37,5 +73,5 @@ class JSONHandler:
     
     @staticmethod
     def load_spaceship_config(file_path: str = "data/spaceship_config.json") -> Dict[str, Any]:
-        """Load spaceship configuration specifically."""
-        return JSONHandler.load_json(file_path)
\ No newline at end of file
+        """Load spaceship configuration specifically (cached, read-only)."""
+        return JSONHandler.load_json_cached(file_path)
\ No newline at end of file